@@ -30,6 +30,22 @@ logger = get_logger(__name__, skill="sdlc-import", phase=1)
 class DecisionExtractor:
     """Extracts architecture decisions from codebase"""
 
+    # ADR markdown fields (compiled once, matched against every ADR file)
+    ADR_NUMBER_PATTERN = re.compile(r'(\d+)')
+    ADR_TITLE_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+    ADR_NUMBER_PREFIX_PATTERN = re.compile(r'^\d+[:\-\s]+')
+    ADR_STATUS_PATTERN = re.compile(r'(?:status|Status):\s*(\w+)', re.IGNORECASE)
+    ADR_DATE_PATTERN = re.compile(r'(?:date|Date):\s*(\d{4}-\d{2}-\d{2})')
+    ADR_CONTEXT_PATTERN = re.compile(r'##\s*Context\s*\n+(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
+    ADR_DECISION_PATTERN = re.compile(r'##\s*Decision\s*\n+(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
+    ADR_CONSEQUENCES_PATTERN = re.compile(r'##\s*Consequences\s*\n+(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
+
+    # Technology markers for inferred decisions (matched against config/code files)
+    POSTGRES_PATTERN = re.compile(r'postgres|postgresql|psql', re.IGNORECASE)
+    MONGODB_PATTERN = re.compile(r'mongodb|mongo:', re.IGNORECASE)
+    OAUTH_PATTERN = re.compile(r'oauth|OAuth|OAUTH')
+    JWT_PATTERN = re.compile(r'jwt|JWT|JsonWebToken')
+
     def __init__(self, config: Dict):
         """
         Initialize decision extractor.
@@ -193,7 +209,7 @@ class DecisionExtractor:
             Decision dict or None
         """
         # Extract ADR number from filename (e.g., "0001-use-postgres.md" -> "ADR-0001")
-        match = re.search(r'(\d+)', filename)
+        match = self.ADR_NUMBER_PATTERN.search(filename)
         if not match:
             return None
 
@@ -201,30 +217,30 @@ class DecisionExtractor:
         adr_id = f"ADR-{adr_num}"
 
         # Extract title from first heading
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        title_match = self.ADR_TITLE_PATTERN.search(content)
         title = title_match.group(1).strip() if title_match else filename.replace('.md', '')
 
         # Remove ADR number prefix from title if present
-        title = re.sub(r'^\d+[:\-\s]+', '', title).strip()
+        title = self.ADR_NUMBER_PREFIX_PATTERN.sub('', title).strip()
 
         # Extract status
-        status_match = re.search(r'(?:status|Status):\s*(\w+)', content, re.IGNORECASE)
+        status_match = self.ADR_STATUS_PATTERN.search(content)
         status = status_match.group(1).lower() if status_match else 'accepted'
 
         # Extract date
-        date_match = re.search(r'(?:date|Date):\s*(\d{4}-\d{2}-\d{2})', content)
+        date_match = self.ADR_DATE_PATTERN.search(content)
         date = date_match.group(1) if date_match else self._get_file_date(file_path)
 
         # Extract context section
-        context_match = re.search(r'##\s*Context\s*\n+(.*?)(?=\n##|\Z)', content, re.DOTALL | re.IGNORECASE)
+        context_match = self.ADR_CONTEXT_PATTERN.search(content)
         context = context_match.group(1).strip() if context_match else ""
 
         # Extract decision section
-        decision_match = re.search(r'##\s*Decision\s*\n+(.*?)(?=\n##|\Z)', content, re.DOTALL | re.IGNORECASE)
+        decision_match = self.ADR_DECISION_PATTERN.search(content)
         decision_text = decision_match.group(1).strip() if decision_match else ""
 
         # Extract consequences
-        consequences_match = re.search(r'##\s*Consequences\s*\n+(.*?)(?=\n##|\Z)', content, re.DOTALL | re.IGNORECASE)
+        consequences_match = self.ADR_CONSEQUENCES_PATTERN.search(content)
         consequences = consequences_match.group(1).strip() if consequences_match else ""
 
         # Determine category based on content
@@ -312,7 +328,7 @@ class DecisionExtractor:
                     content = file_path.read_text()
 
                     # PostgreSQL
-                    if re.search(r'postgres|postgresql|psql', content, re.IGNORECASE):
+                    if self.POSTGRES_PATTERN.search(content):
                         return {
                             'id': 'ADR-INFERRED-DATABASE',
                             'title': 'Use PostgreSQL as Primary Database',
@@ -327,7 +343,7 @@ class DecisionExtractor:
                         }
 
                     # MongoDB
-                    if re.search(r'mongodb|mongo:', content, re.IGNORECASE):
+                    if self.MONGODB_PATTERN.search(content):
                         return {
                             'id': 'ADR-INFERRED-DATABASE',
                             'title': 'Use MongoDB as Primary Database',
@@ -353,7 +369,7 @@ class DecisionExtractor:
             try:
                 content = file_path.read_text()
 
-                if re.search(r'oauth|OAuth|OAUTH', content):
+                if self.OAUTH_PATTERN.search(content):
                     return {
                         'id': 'ADR-INFERRED-AUTH',
                         'title': 'Use OAuth 2.0 for Authentication',
@@ -366,7 +382,7 @@ class DecisionExtractor:
                         'source': 'inferred_from_code'
                     }
 
-                if re.search(r'jwt|JWT|JsonWebToken', content):
+                if self.JWT_PATTERN.search(content):
                     return {
                         'id': 'ADR-INFERRED-AUTH',
                         'title': 'Use JWT for Authentication Tokens',
@@ -471,3 +487,34 @@ class DecisionExtractor:
             pass
 
         return count
+
+
+def main(argv: Optional[List[str]] = None, stdout=None):
+    """
+    Extract decisions from a project and print them as JSON.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        stdout: Stream for the JSON output (defaults to sys.stdout)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extract architecture decisions from project")
+    parser.add_argument("project_path", help="Path to project")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--no-llm", action="store_true", help="Use pattern matching only")
+
+    args = parser.parse_args(argv)
+
+    config_path = Path(args.config) if args.config else Path(__file__).parent.parent / "config" / "import_config.yml"
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    extractor = DecisionExtractor(config)
+    result = extractor.extract(Path(args.project_path), {}, no_llm=args.no_llm)
+
+    print(json.dumps(result, indent=2), file=stdout or sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
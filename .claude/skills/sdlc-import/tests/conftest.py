@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the sdlc-import test suite.
+
+The tests write and re-read many small fixture files. On Linux they can be
+routed through the RAM-backed /dev/shm instead of the on-disk temp dir by
+setting SDLC_TEST_TMPFS=1.
+The repository root is resolved once and shared via the repo_root fixture,
+and the parsed import_config.yml via the import_config fixture.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+# tests/ -> sdlc-import/ -> skills/ -> .claude/ -> repo root (resolved once)
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+# RAM-backed tmpfs (Linux), used only when SDLC_TEST_TMPFS=1
+_SHM_DIR = "/dev/shm"
+_TMPFS_ENV = "SDLC_TEST_TMPFS"
+# tempfile.tempdir before pytest_configure, restored by pytest_unconfigure
+_saved_tempdir = None
+
+IMPORT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "import_config.yml"
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def pytest_configure(config):
+    """
+    Point the temp dir at /dev/shm when SDLC_TEST_TMPFS=1 (opt-in).
+
+    Off by default: the override applies to every tempfile user in the
+    session, and container tmpfs mounts are often small. An explicit TMPDIR
+    wins over SDLC_TEST_TMPFS.
+
+    Covers both pytest's tmp_path / tmp_path_factory root (resolved lazily
+    from tempfile.gettempdir()) and plain tempfile.TemporaryDirectory() calls.
+    An explicit --basetemp still takes precedence for tmp_path.
+    """
+    global _saved_tempdir
+    _saved_tempdir = tempfile.tempdir
+    if os.environ.get(_TMPFS_ENV) != "1" or "TMPDIR" in os.environ:
+        return
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        tempfile.tempdir = _SHM_DIR
+
+
+def pytest_unconfigure(config):
+    """Restore the temp dir pytest_configure replaced."""
+    tempfile.tempdir = _saved_tempdir
+
+
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    """Repository root (the directory holding .claude/)"""
+    return REPO_ROOT
+
+
+@pytest.fixture(scope="session")
+def import_config(request):
+    """
+    Parsed sdlc-import config/import_config.yml, persisted in pytest's cache.
+
+    The entry is keyed by the file's mtime and size, so later runs skip the
+    YAML parse until the file changes. Runs without the cache plugin
+    (-p no:cacheprovider) parse every time. Shared across tests: copy before
+    modifying.
+    """
+    stat = IMPORT_CONFIG_PATH.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache = getattr(request.config, "cache", None)
+
+    if cache is not None:
+        entry = cache.get("sdlc-import/import_config", None)
+        if entry is not None and entry.get("stamp") == stamp:
+            return entry["config"]
+
+    with open(IMPORT_CONFIG_PATH, 'rb') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+    if cache is not None:
+        cache.set("sdlc-import/import_config", {"stamp": stamp, "config": config})
+    return config
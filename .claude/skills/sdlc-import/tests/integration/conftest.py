@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for sdlc-import integration tests.
+
+The sdlc-import scripts and the shared SDLC library are put on sys.path by
+the `pythonpath` setting in the repository's pytest.ini, so test modules can
+import ProjectAnalyzer / InfrastructurePreserver directly.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from integration_helpers import content_digest
+
+# Stands in for the analyzed project's path in cached analysis results
+_PROJECT_PATH_PLACEHOLDER = "<project_path>"
+
+
+@pytest.fixture
+def clone_project(tmp_path):
+    """
+    Factory returning a private copy of a session-scoped project template.
+
+    analyze() checks out a feature branch and writes .project/ artifacts, so
+    tests get their own tree; copying it is far cheaper than rebuilding the
+    files and re-running git for every test.
+    """
+    def _clone(template: Path) -> Path:
+        project_path = tmp_path / template.name
+        shutil.copytree(template, project_path, symlinks=True)
+        return project_path
+
+    return _clone
+
+
+@pytest.fixture(scope="session")
+def session_clone_project(tmp_path_factory):
+    """
+    Session-scoped variant of clone_project.
+
+    For fixtures that analyze a copy once and share the (read-only) result
+    across tests.
+    """
+    def _clone(template: Path) -> Path:
+        project_path = tmp_path_factory.mktemp("analyzed") / template.name
+        shutil.copytree(template, project_path, symlinks=True)
+        return project_path
+
+    return _clone
+
+
+def _replace_in_strings(value, old: str, new: str):
+    """
+    Copy of a JSON-like value with old replaced by new in every string.
+
+    Works on the decoded object rather than the serialized text, where JSON
+    escaping (e.g. Windows backslashes) would hide the path.
+    """
+    if isinstance(value, str):
+        return value.replace(old, new)
+    if isinstance(value, dict):
+        return {
+            _replace_in_strings(k, old, new): _replace_in_strings(v, old, new)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_replace_in_strings(item, old, new) for item in value]
+    return value
+
+
+@pytest.fixture(scope="session")
+def cached_analysis(request):
+    """
+    Factory returning analyze() (default flags minus threat model / tech debt)
+    for a fixture tree, persisted in pytest's cache across runs.
+
+    Entries are keyed by content_digest() of the fixture files and analyzer
+    sources, so an unchanged tree skips analyze() entirely on later runs.
+    The analyzed project's path is stored as a placeholder and re-pointed at
+    the current session's copy on load. Runs without the cache plugin
+    (-p no:cacheprovider) always analyze.
+    """
+    cache = getattr(request.config, "cache", None)
+
+    def _analysis(name: str, files, analyzer):
+        if cache is None:
+            return analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
+
+        key = f"sdlc-import/analysis/{name}"
+        digest = content_digest(files)
+        project_path = str(analyzer.project_path)
+
+        entry = cache.get(key, None)
+        if entry is not None and entry.get("digest") == digest:
+            return _replace_in_strings(
+                json.loads(entry["result"]), _PROJECT_PATH_PLACEHOLDER, project_path
+            )
+
+        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
+        cache.set(key, {
+            "digest": digest,
+            "result": json.dumps(
+                _replace_in_strings(result, project_path, _PROJECT_PATH_PLACEHOLDER)
+            ),
+        })
+        return result
+
+    return _analysis
+
+
+# Tests that run the threat-model / tech-debt steps skipped everywhere else.
+HEAVY_TEST_PREFIXES = ("test_threat_modeling", "test_tech_debt_detection")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Move the heavy analysis tests to the front of their module.
+
+    Longest-processing-time-first: under parallel runs the slow tests start
+    early instead of becoming the tail while other workers idle. Items stay
+    grouped by module so module/class-scoped fixtures are not rebuilt.
+    """
+    here = Path(__file__).parent
+    module_order = {}
+    for item in items:
+        module_order.setdefault(item.path, len(module_order))
+
+    def sort_key(item):
+        heavy = item.path.parent == here and item.name.startswith(HEAVY_TEST_PREFIXES)
+        return (module_order[item.path], 0 if heavy else 1)
+
+    items.sort(key=sort_key)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the sdlc-import integration test fixtures.
+
+Kept out of conftest.py so test modules can import them by a unique name.
+"""
+
+import hashlib
+import os
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, FrozenSet, Set
+
+
+_SKILL_DIR = Path(__file__).resolve().parent.parent.parent
+# Everything ProjectAnalyzer's output depends on besides the project itself
+_ANALYZER_SOURCE_DIRS = (
+    _SKILL_DIR / "scripts",
+    _SKILL_DIR / "config",
+    _SKILL_DIR / "templates",
+    _SKILL_DIR.parent.parent / "lib/python",
+)
+# Third-party distributions whose behaviour shapes the analyzer's output
+_ANALYZER_DISTRIBUTIONS = ("PyYAML", "Jinja2")
+
+_WRITE_WORKERS = 8
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+@dataclass(frozen=True)
+class AnalysisView:
+    """Sections of a cached analyze() result, extracted once per session"""
+    result: Dict
+    scan: Dict
+    lang: Dict
+    testing_frameworks: FrozenSet[str]  # lowercased
+
+    @classmethod
+    def of(cls, result: Dict) -> "AnalysisView":
+        lang = result["language_analysis"]
+        testing = lang.get("frameworks", {}).get("testing", [])
+        return cls(result, result["scan"], lang, frozenset(f.lower() for f in testing))
+
+
+def project_analyzer_cls():
+    """
+    Import ProjectAnalyzer on first use.
+
+    Deferred so collection-only runs (--collect-only, xdist sharding) do not
+    pay for importing the analyzer and its sub-analyzers.
+    """
+    from project_analyzer import ProjectAnalyzer
+    return ProjectAnalyzer
+
+
+def _distribution_version(name: str) -> str:
+    """Installed version of a distribution ("" when it is not installed)"""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def _analyzer_sources_digest() -> str:
+    """
+    SHA-256 over the analyzer's scripts, config, templates and shared library,
+    plus the Python and PyYAML/Jinja2 versions it runs on.
+    """
+    digest = hashlib.sha256(sys.version.encode())
+    for name in _ANALYZER_DISTRIBUTIONS:
+        digest.update(f"{name}=={_distribution_version(name)}".encode())
+    for source_dir in _ANALYZER_SOURCE_DIRS:
+        for path in sorted(source_dir.rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts:
+                digest.update(path.relative_to(source_dir).as_posix().encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def content_digest(files: Dict[str, bytes]) -> str:
+    """
+    Content hash of a {relative path: encoded content} fixture tree.
+
+    Also covers the analyzer sources and runtime versions, so a result cached
+    under the digest is invalidated by changes to the fixture, ProjectAnalyzer,
+    the Python interpreter or PyYAML/Jinja2.
+    """
+    digest = hashlib.sha256(_analyzer_sources_digest().encode())
+    for rel_path in sorted(files):
+        digest.update(rel_path.encode())
+        digest.update(files[rel_path])
+    return digest.hexdigest()
+
+
+def write_bytes(path: Path, data: bytes):
+    """Write data with one open/write/close, bypassing the io/codecs layers"""
+    fd = os.open(str(path), _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def create_file(path: Path, content: str):
+    """Helper to create file with content"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_bytes(path, content.encode("utf-8"))
+
+
+def encode_files(files: Dict[str, str]) -> Dict[str, bytes]:
+    """
+    UTF-8 encode a {relative path: content} mapping.
+
+    Meant to be applied to module-level fixture constants, so the encoding
+    happens once at import instead of on every fixture build.
+    """
+    return {rel_path: content.encode("utf-8") for rel_path, content in files.items()}
+
+
+def write_files(project_path: Path, files: Dict[str, bytes]):
+    """
+    Create a fixture tree from a {relative path: encoded content} mapping.
+
+    Each distinct parent directory is created once (shallowest first) instead
+    of calling mkdir(parents=True) for every file. The files themselves are
+    independent, so they are written from a small thread pool (os.write
+    releases the GIL).
+    """
+    parents = {Path(rel_path).parent for rel_path in files}
+    for parent in sorted(parents, key=lambda p: len(p.parts)):
+        (project_path / parent).mkdir(parents=True, exist_ok=True)
+
+    def _write(item):
+        rel_path, data = item
+        write_bytes(project_path / rel_path, data)
+
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+        # list() drains the iterator so worker exceptions are re-raised here
+        list(executor.map(_write, files.items()))
+
+
+# Minimal .git/ contents: branch "main" holding one empty commit with a pinned
+# identity and date, so the commit id is identical on every run.
+FIXTURE_EPOCH = 946684800  # 2000-01-01T00:00:00Z
+_GIT_IDENTITY = b"Test User <test@example.com> %d +0000" % FIXTURE_EPOCH
+_GIT_CONFIG = b"""[core]
+\trepositoryformatversion = 0
+\tbare = false
+[user]
+\temail = test@example.com
+\tname = Test User
+"""
+
+
+def _write_git_object(git_dir: Path, obj_type: bytes, body: bytes) -> str:
+    """Store a loose object (zlib-compressed "<type> <size>\\0<body>") and return its id"""
+    data = b"%s %d\x00%s" % (obj_type, len(body), body)
+    object_id = hashlib.sha1(data).hexdigest()
+    object_dir = git_dir / "objects" / object_id[:2]
+    object_dir.mkdir(parents=True, exist_ok=True)
+    write_bytes(object_dir / object_id[2:], zlib.compress(data))
+    return object_id
+
+
+def init_git_repo(project_path: Path):
+    """
+    Turn project_path into a git repository without spawning git.
+
+    Writes HEAD, config, refs and the loose objects of an empty commit
+    directly; ProjectAnalyzer only needs a valid repo with a HEAD commit to
+    create its feature branch from.
+    """
+    git_dir = project_path / ".git"
+    for sub_dir in ("objects/info", "objects/pack", "refs/heads", "refs/tags"):
+        (git_dir / sub_dir).mkdir(parents=True, exist_ok=True)
+
+    tree_id = _write_git_object(git_dir, b"tree", b"")
+    commit_id = _write_git_object(
+        git_dir, b"commit",
+        b"tree %s\nauthor %s\ncommitter %s\n\nInitial commit\n"
+        % (tree_id.encode(), _GIT_IDENTITY, _GIT_IDENTITY)
+    )
+
+    write_bytes(git_dir / "refs" / "heads" / "main", commit_id.encode() + b"\n")
+    write_bytes(git_dir / "HEAD", b"ref: refs/heads/main\n")
+    write_bytes(git_dir / "config", _GIT_CONFIG)
+
+
+def local_branches(project_path: Path) -> Set[str]:
+    """
+    Names of the local branches of project_path, read from .git/ directly.
+
+    Same answer as `git branch`, without spawning git: loose refs under
+    refs/heads plus any entries in packed-refs.
+    """
+    git_dir = project_path / ".git"
+    heads_dir = git_dir / "refs" / "heads"
+    branches = {
+        ref.relative_to(heads_dir).as_posix()
+        for ref in heads_dir.rglob("*") if ref.is_file()
+    }
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.exists():
+        for line in packed_refs.read_text().splitlines():
+            _, _, ref_name = line.partition(" ")
+            if ref_name.startswith("refs/heads/"):
+                branches.add(ref_name[len("refs/heads/"):])
+    return branches
+
+
+def make_project(project_path: Path, files: Dict[str, bytes]) -> Path:
+    """
+    Write a {relative path: encoded content} fixture tree and make it a git repo.
+
+    File mtimes are pinned to FIXTURE_EPOCH, the date of the synthesized
+    commit, so everything derived from the tree (e.g. dates DecisionExtractor
+    reads from st_mtime) is the same on every run.
+    """
+    write_files(project_path, files)
+    for rel_path in files:
+        os.utime(project_path / rel_path, (FIXTURE_EPOCH, FIXTURE_EPOCH))
+    init_git_repo(project_path)
+    return project_path
@@ -15,6 +15,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".cla
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from project_analyzer import ProjectAnalyzer
+from integration_helpers import init_git_repo
+
+pytestmark = pytest.mark.integration
 
 
 def create_file(path: Path, content: str):
@@ -114,12 +117,7 @@ C++ project using CMake and Boost.
         )
 
         # Initialize git (required for analyze())
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=str(project_path), check=True, capture_output=True)
+        init_git_repo(project_path)
 
         yield project_path
 
@@ -23,6 +23,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".cla
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from project_analyzer import ProjectAnalyzer
+from integration_helpers import init_git_repo, local_branches
+
+pytestmark = pytest.mark.integration
 
 
 def create_file(path: Path, content: str):
@@ -138,12 +141,7 @@ This is a sample Django project.
         )
 
         # Initialize git (required for analyze())
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=str(project_path), check=True, capture_output=True)
+        init_git_repo(project_path)
 
         yield project_path
 
@@ -189,14 +187,7 @@ class TestDjangoIntegration:
         assert result["branch"]["created"] is True
 
         # Verify branch exists in git
-        import subprocess
-        branches_result = subprocess.run(
-            ["git", "branch"],
-            cwd=str(django_project),
-            capture_output=True,
-            text=True
-        )
-        assert branch_name in branches_result.stdout
+        assert branch_name in local_branches(django_project)
 
     def test_directory_scan_django(self, django_project):
         """Test directory scanning (Step 3)"""
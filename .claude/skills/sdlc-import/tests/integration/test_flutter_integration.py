@@ -5,22 +5,15 @@ Integration tests for Flutter/Dart project analysis.
 Tests the full sdlc-import workflow on a sample Flutter mobile project.
 """
 
-import sys
 import pytest
 import tempfile
 from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".claude/lib/python"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-
+# Import roots come from pythonpath in the repo-root pytest.ini
 from project_analyzer import ProjectAnalyzer
+from integration_helpers import create_file, init_git_repo
 
-
-def create_file(path: Path, content: str):
-    """Helper to create file with content"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+pytestmark = pytest.mark.integration
 
 
 @pytest.fixture
@@ -184,12 +177,7 @@ A Flutter mobile application.
         )
 
         # Initialize git (required for analyze())
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=str(project_path), check=True, capture_output=True)
+        init_git_repo(project_path)
 
         yield project_path
 
@@ -212,11 +200,7 @@ class TestFlutterIntegration:
     def test_language_detection_dart(self, flutter_project):
         """Test Dart language detection"""
         analyzer = ProjectAnalyzer(str(flutter_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        # Verify language detection
-        assert "language_analysis" in result
-        lang_analysis = result["language_analysis"]
+        lang_analysis = analyzer.detect_languages()
 
         assert "primary_language" in lang_analysis
         assert lang_analysis["primary_language"] == "dart"
@@ -228,11 +212,7 @@ class TestFlutterIntegration:
     def test_flutter_framework_detection(self, flutter_project):
         """Test Flutter framework detection"""
         analyzer = ProjectAnalyzer(str(flutter_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        # Verify framework detection
-        assert "language_analysis" in result
-        frameworks = result["language_analysis"]["frameworks"]
+        frameworks = analyzer.detect_languages()["frameworks"]
 
         # Flutter should be detected as mobile framework
         assert "mobile" in frameworks
@@ -242,10 +222,7 @@ class TestFlutterIntegration:
     def test_flutter_widgets_detection(self, flutter_project):
         """Test Flutter widgets pattern detection"""
         analyzer = ProjectAnalyzer(str(flutter_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        # Verify Flutter widgets detected
-        frameworks = result["language_analysis"]["frameworks"]
+        frameworks = analyzer.detect_languages()["frameworks"]
         mobile_frameworks = [f.lower() for f in frameworks["mobile"]]
 
         # Should detect Flutter widgets pattern
@@ -254,10 +231,7 @@ class TestFlutterIntegration:
     def test_file_count_dart(self, flutter_project):
         """Test that Dart files are counted correctly"""
         analyzer = ProjectAnalyzer(str(flutter_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        # Verify scan results
-        scan = result["scan"]
+        scan = analyzer.scan_directory()
         files_by_ext = scan["files_by_extension"]
 
         # Should detect .dart files
@@ -267,10 +241,7 @@ class TestFlutterIntegration:
     def test_lsp_plugin_dart(self, flutter_project):
         """Test that dart LSP plugin is identified"""
         analyzer = ProjectAnalyzer(str(flutter_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        # Verify LSP analysis
-        lsp_analysis = result["language_analysis"].get("lsp_analysis", {})
+        lsp_analysis = analyzer.detect_languages().get("lsp_analysis", {})
 
         # dart-lsp should be identified for Dart
         if "dart" in lsp_analysis:
@@ -5,22 +5,15 @@ Integration tests for Go/Gin project analysis.
 Tests the full sdlc-import workflow on a sample Go project.
 """
 
-import sys
 import pytest
 import tempfile
 from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".claude/lib/python"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-
+# Import roots come from pythonpath in the repo-root pytest.ini
 from project_analyzer import ProjectAnalyzer
+from integration_helpers import create_file, init_git_repo
 
-
-def create_file(path: Path, content: str):
-    """Helper to create file with content"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+pytestmark = pytest.mark.integration
 
 
 @pytest.fixture
@@ -416,13 +409,8 @@ A sample REST API built with Go and Gin framework.
 """
         )
 
-        # Initialize git
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=str(project_path), check=True, capture_output=True)
+        # Initialize git (required for analyze())
+        init_git_repo(project_path)
 
         yield project_path
 
@@ -443,18 +431,15 @@ class TestGinIntegration:
     def test_branch_creation_gin(self, gin_project):
         """Test that feature branch is created"""
         analyzer = ProjectAnalyzer(str(gin_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
+        branch = analyzer.create_feature_branch()
 
-        branch_name = result["branch"]["branch"]
-        assert branch_name.startswith("feature/import-")
-        assert result["branch"]["created"] is True
+        assert branch["branch"].startswith("feature/import-")
+        assert branch["created"] is True
 
     def test_directory_scan_gin(self, gin_project):
         """Test directory scanning"""
         analyzer = ProjectAnalyzer(str(gin_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        scan = result["scan"]
+        scan = analyzer.scan_directory()
         assert scan["total_files"] >= 4
         assert ".go" in scan["files_by_extension"]
 
@@ -470,9 +455,7 @@ class TestGinIntegration:
     def test_language_detection_gin(self, gin_project):
         """Test language detection"""
         analyzer = ProjectAnalyzer(str(gin_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        lang_analysis = result["language_analysis"]
+        lang_analysis = analyzer.detect_languages()
         assert lang_analysis["primary_language"] == "go"
         assert "go" in lang_analysis["languages"]
         assert lang_analysis["languages"]["go"]["percentage"] > 50
@@ -480,35 +463,30 @@ class TestGinIntegration:
     def test_decision_extraction_gin(self, gin_project):
         """Test decision extraction"""
         analyzer = ProjectAnalyzer(str(gin_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        decisions = result["decisions"]
+        decisions = analyzer.extract_decisions(analyzer.detect_languages())
         assert "count" in decisions
         assert decisions["count"] >= 0
 
     def test_diagram_generation_gin(self, gin_project):
         """Test diagram generation"""
         analyzer = ProjectAnalyzer(str(gin_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        diagrams = result["diagrams"]
+        language_analysis = analyzer.detect_languages()
+        decisions = analyzer.extract_decisions(language_analysis)
+        diagrams = analyzer.generate_diagrams(language_analysis, decisions)
         assert isinstance(diagrams["diagrams"], list)
 
     def test_threat_modeling_gin(self, gin_project):
         """Test threat modeling"""
         analyzer = ProjectAnalyzer(str(gin_project))
-        result = analyzer.analyze(skip_threat_model=False, skip_tech_debt=True)
-
-        threats = result["threats"]
+        decisions = analyzer.extract_decisions(analyzer.detect_languages())
+        threats = analyzer.model_threats(decisions)
         if "status" in threats:
             assert threats["status"] != "skipped"
 
     def test_tech_debt_detection_gin(self, gin_project):
         """Test tech debt detection"""
         analyzer = ProjectAnalyzer(str(gin_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=False)
-
-        tech_debt = result["tech_debt"]
+        tech_debt = analyzer.detect_tech_debt()
         if "status" in tech_debt:
             assert tech_debt["status"] != "skipped"
 
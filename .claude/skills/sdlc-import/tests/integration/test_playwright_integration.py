@@ -6,34 +6,17 @@ Tests the full sdlc-import workflow on a sample Playwright E2E testing project.
 Tests multi-language testing framework detection (TypeScript Playwright).
 """
 
-import sys
 import pytest
-import tempfile
-from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".claude/lib/python"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+from integration_helpers import AnalysisView, encode_files, make_project, project_analyzer_cls
 
-from project_analyzer import ProjectAnalyzer
+pytestmark = pytest.mark.integration
 
 
-def create_file(path: Path, content: str):
-    """Helper to create file with content"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
-
-
-@pytest.fixture
-def playwright_project():
-    """Create a minimal Playwright E2E testing project structure"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-
-        # Create package.json
-        create_file(
-            project_path / "package.json",
-            """{
+# Minimal Playwright E2E project, {relative path: UTF-8 bytes}
+PLAYWRIGHT_PROJECT_FILES = encode_files({
+    # Create package.json
+    "package.json": """{
   "name": "e2e-tests",
   "version": "1.0.0",
   "description": "E2E tests using Playwright",
@@ -48,13 +31,9 @@ def playwright_project():
     "typescript": "^5.3.2"
   }
 }
-"""
-        )
-
-        # Create playwright.config.ts
-        create_file(
-            project_path / "playwright.config.ts",
-            """import { defineConfig, devices } from '@playwright/test';
+""",
+    # Create playwright.config.ts
+    "playwright.config.ts": """import { defineConfig, devices } from '@playwright/test';
 
 export default defineConfig({
   testDir: './tests',
@@ -81,13 +60,9 @@ export default defineConfig({
     },
   ],
 });
-"""
-        )
-
-        # Create test files
-        create_file(
-            project_path / "tests/home.spec.ts",
-            """import { test, expect } from '@playwright/test';
+""",
+    # Create test files
+    "tests/home.spec.ts": """import { test, expect } from '@playwright/test';
 
 test.describe('Home Page', () => {
   test('should display welcome message', async ({ page }) => {
@@ -105,12 +80,8 @@ test.describe('Home Page', () => {
     await expect(page.locator('h1')).toContainText('About');
   });
 });
-"""
-        )
-
-        create_file(
-            project_path / "tests/login.spec.ts",
-            """import { test, expect } from '@playwright/test';
+""",
+    "tests/login.spec.ts": """import { test, expect } from '@playwright/test';
 
 test.describe('Login Flow', () => {
   test('should login with valid credentials', async ({ page }) => {
@@ -135,12 +106,8 @@ test.describe('Login Flow', () => {
     await expect(page.locator('.error-message')).toContainText('Invalid credentials');
   });
 });
-"""
-        )
-
-        create_file(
-            project_path / "tests/api.spec.ts",
-            """import { test, expect } from '@playwright/test';
+""",
+    "tests/api.spec.ts": """import { test, expect } from '@playwright/test';
 
 test.describe('API Tests', () => {
   test('should fetch user data', async ({ request }) => {
@@ -154,13 +121,9 @@ test.describe('API Tests', () => {
     expect(data).toHaveProperty('email');
   });
 });
-"""
-        )
-
-        # Create helper/fixture file
-        create_file(
-            project_path / "tests/fixtures.ts",
-            """import { test as base } from '@playwright/test';
+""",
+    # Create helper/fixture file
+    "tests/fixtures.ts": """import { test as base } from '@playwright/test';
 
 export type TestFixtures = {
   authenticatedPage: any;
@@ -178,13 +141,9 @@ export const test = base.extend<TestFixtures>({
 });
 
 export { expect } from '@playwright/test';
-"""
-        )
-
-        # Create tsconfig.json
-        create_file(
-            project_path / "tsconfig.json",
-            """{
+""",
+    # Create tsconfig.json
+    "tsconfig.json": """{
   "compilerOptions": {
     "target": "ES2020",
     "module": "commonjs",
@@ -196,51 +155,61 @@ export { expect } from '@playwright/test';
   },
   "include": ["tests/**/*.ts"]
 }
-"""
-        )
-
-        create_file(
-            project_path / "README.md",
-            """# E2E Tests
+""",
+    "README.md": """# E2E Tests
 
 Playwright E2E tests for web application.
-"""
-        )
+""",
+})
+
+
+@pytest.fixture(scope="session")
+def playwright_template(tmp_path_factory):
+    """Create a minimal Playwright E2E testing project structure (once per session)"""
+    return make_project(tmp_path_factory.mktemp("playwright"), PLAYWRIGHT_PROJECT_FILES)
+
+
+@pytest.fixture(scope="session")
+def playwright_analyzed_project(playwright_template, session_clone_project):
+    """Copy of the Playwright project that playwright_analysis runs against"""
+    return session_clone_project(playwright_template)
+
 
-        # Initialize git (required for analyze())
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=str(project_path), check=True, capture_output=True)
+@pytest.fixture(scope="session")
+def playwright_analyzer(playwright_analyzed_project):
+    """Single ProjectAnalyzer shared by every test of the Playwright project"""
+    return project_analyzer_cls()(str(playwright_analyzed_project))
 
-        yield project_path
+
+@pytest.fixture(scope="session")
+def playwright_analysis(playwright_analyzer):
+    """analyze() result shared by every test that uses the default flags"""
+    return playwright_analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
+
+
+@pytest.fixture(scope="session")
+def playwright(playwright_analysis):
+    """Cached playwright_analysis with its scan / language sections pre-extracted"""
+    return AnalysisView.of(playwright_analysis)
 
 
 class TestPlaywrightIntegration:
     """Integration tests for Playwright project analysis"""
 
-    def test_analyze_basic_structure(self, playwright_project):
+    def test_analyze_basic_structure(self, playwright):
         """Test that analyze() returns basic result structure"""
-        analyzer = ProjectAnalyzer(str(playwright_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
         # Verify basic structure
-        assert "analysis_id" in result
-        assert "timestamp" in result
-        assert "project_path" in result
-        assert "branch" in result
-        assert "scan" in result
+        assert "analysis_id" in playwright.result
+        assert "timestamp" in playwright.result
+        assert "project_path" in playwright.result
+        assert "branch" in playwright.result
+        assert "scan" in playwright.result
 
-    def test_language_detection_typescript(self, playwright_project):
+    def test_language_detection_typescript(self, playwright):
         """Test TypeScript language detection"""
-        analyzer = ProjectAnalyzer(str(playwright_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
         # Verify language detection
-        assert "language_analysis" in result
-        lang_analysis = result["language_analysis"]
+        assert "language_analysis" in playwright.result
+        lang_analysis = playwright.lang
 
         assert "primary_language" in lang_analysis
         assert lang_analysis["primary_language"] == "typescript"
@@ -248,27 +217,20 @@ class TestPlaywrightIntegration:
         assert "languages" in lang_analysis
         assert "typescript" in lang_analysis["languages"]
 
-    def test_playwright_testing_framework_detection(self, playwright_project):
+    def test_playwright_testing_framework_detection(self, playwright):
         """Test Playwright testing framework detection"""
-        analyzer = ProjectAnalyzer(str(playwright_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
         # Verify framework detection
-        assert "language_analysis" in result
-        frameworks = result["language_analysis"]["frameworks"]
+        assert "language_analysis" in playwright.result
+        frameworks = playwright.lang["frameworks"]
 
         # Playwright should be detected as testing framework
         assert "testing" in frameworks
-        testing_frameworks = [f.lower() for f in frameworks["testing"]]
-        assert "playwright" in testing_frameworks
+        assert "playwright" in playwright.testing_frameworks
 
-    def test_file_count_typescript(self, playwright_project):
+    def test_file_count_typescript(self, playwright):
         """Test that TypeScript files are counted correctly"""
-        analyzer = ProjectAnalyzer(str(playwright_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
         # Verify scan results
-        scan = result["scan"]
+        scan = playwright.scan
         files_by_ext = scan["files_by_extension"]
 
         # Should detect .ts files
@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+Integration tests for React/Express and Spring Boot project analysis.
+
+Tests the full sdlc-import workflow on a sample JavaScript/TypeScript project
+and a sample Java project, with one parametrized test class for both.
+"""
+
+import pytest
+from dataclasses import dataclass
+from typing import Tuple
+
+from project_analyzer import ProjectAnalyzer
+from integration_helpers import encode_files, local_branches, make_project
+
+pytestmark = pytest.mark.integration
+
+
+# Minimal React/Express project, {relative path: UTF-8 bytes}.
+# Only what the assertions need: package.json (jest/react detection), TypeScript
+# sources (primary language), one test file. No tsconfig.json / README.md.
+REACT_PROJECT_FILES = encode_files({
+    # Create package.json
+    "package.json": """{
+  "name": "my-react-app",
+  "version": "1.0.0",
+  "dependencies": {
+    "react": "^18.2.0",
+    "react-dom": "^18.2.0",
+    "express": "^4.18.2",
+    "axios": "^1.4.0",
+    "jsonwebtoken": "^9.0.0"
+  },
+  "devDependencies": {
+    "@testing-library/react": "^13.4.0",
+    "jest": "^29.5.0",
+    "typescript": "^5.0.0"
+  }
+}
+""",
+    # Create React component
+    "src/components/App.tsx": """import React, { useState, useEffect } from 'react';
+import axios from 'axios';
+
+interface User {
+  id: number;
+  name: string;
+}
+
+export const App: React.FC = () => {
+  const [users, setUsers] = useState<User[]>([]);
+
+  useEffect(() => {
+    axios.get<User[]>('/api/users')
+      .then(response => setUsers(response.data))
+      .catch(error => console.error('Failed to fetch users:', error));
+  }, []);
+
+  return (
+    <div>
+      <h1>Users</h1>
+      <ul>
+        {users.map(user => (
+          <li key={user.id}>{user.name}</li>
+        ))}
+      </ul>
+    </div>
+  );
+};
+""",
+    # Create Express server
+    "src/server/index.ts": """import express from 'express';
+import jwt from 'jsonwebtoken';
+
+const app = express();
+const PORT = process.env.PORT || 3000;
+const JWT_SECRET = process.env.JWT_SECRET || 'dev-secret';
+
+app.use(express.json());
+
+// Authentication middleware
+const authenticate = (req: any, res: any, next: any) => {
+  const token = req.headers.authorization?.split(' ')[1];
+  if (!token) {
+    return res.status(401).json({ error: 'No token provided' });
+  }
+
+  try {
+    const decoded = jwt.verify(token, JWT_SECRET);
+    req.user = decoded;
+    next();
+  } catch (error) {
+    return res.status(401).json({ error: 'Invalid token' });
+  }
+};
+
+// API routes
+app.get('/api/users', authenticate, async (req, res) => {
+  res.json([{ id: 1, name: 'Alice' }]);
+});
+
+app.listen(PORT, () => {
+  console.log(`Server running on port ${PORT}`);
+});
+""",
+    # Create test file
+    "src/components/__tests__/App.test.tsx": """import React from 'react';
+import { render, screen, waitFor } from '@testing-library/react';
+import { App } from '../App';
+import axios from 'axios';
+
+jest.mock('axios');
+const mockedAxios = axios as jest.Mocked<typeof axios>;
+
+describe('App', () => {
+  it('renders users list', async () => {
+    mockedAxios.get.mockResolvedValue({ data: [{ id: 1, name: 'Alice' }] });
+
+    render(<App />);
+
+    await waitFor(() => expect(screen.getByText('Alice')).toBeInTheDocument());
+  });
+});
+""",
+})
+
+
+@pytest.fixture(scope="session")
+def react_template(tmp_path_factory):
+    """Create a minimal React/Express project structure (once per session)"""
+    return make_project(tmp_path_factory.mktemp("react"), REACT_PROJECT_FILES)
+
+
+@pytest.fixture
+def react_project(react_template, clone_project):
+    """Per-test copy of the session-scoped React/Express project"""
+    return clone_project(react_template)
+
+
+@pytest.fixture(scope="session")
+def react_analyzed_project(react_template, session_clone_project):
+    """Copy of the React/Express project that react_analysis runs against"""
+    return session_clone_project(react_template)
+
+
+@pytest.fixture(scope="session")
+def react_analyzer(react_analyzed_project):
+    """Single ProjectAnalyzer shared by every test of the React/Express project"""
+    return ProjectAnalyzer(str(react_analyzed_project))
+
+
+@pytest.fixture(scope="session")
+def react_analysis(react_analyzer, cached_analysis):
+    """analyze() result shared by every test that uses the default flags"""
+    return cached_analysis("react", REACT_PROJECT_FILES, react_analyzer)
+
+
+# Minimal Spring Boot project, {relative path: UTF-8 bytes}.
+# Only what the assertions need: pom.xml (Spring detection), >= 5 Java sources
+# (primary language), README.md. No application.properties.
+SPRING_PROJECT_FILES = encode_files({
+    # Create pom.xml
+    "pom.xml": """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0"
+         xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+         xsi:schemaLocation="http://maven.apache.org/POM/4.0.0
+         https://maven.apache.org/xsd/maven-4.0.0.xsd">
+    <modelVersion>4.0.0</modelVersion>
+    <parent>
+        <groupId>org.springframework.boot</groupId>
+        <artifactId>spring-boot-starter-parent</artifactId>
+        <version>3.2.0</version>
+    </parent>
+    <groupId>com.example</groupId>
+    <artifactId>demo</artifactId>
+    <version>0.0.1-SNAPSHOT</version>
+    <name>demo</name>
+    <description>Demo project for Spring Boot</description>
+
+    <properties>
+        <java.version>17</java.version>
+    </properties>
+
+    <dependencies>
+        <dependency>
+            <groupId>org.springframework.boot</groupId>
+            <artifactId>spring-boot-starter-web</artifactId>
+        </dependency>
+        <dependency>
+            <groupId>org.springframework.boot</groupId>
+            <artifactId>spring-boot-starter-data-jpa</artifactId>
+        </dependency>
+        <dependency>
+            <groupId>org.springframework.boot</groupId>
+            <artifactId>spring-boot-starter-security</artifactId>
+        </dependency>
+    </dependencies>
+</project>
+""",
+    # Create main application
+    "src/main/java/com/example/demo/DemoApplication.java": """package com.example.demo;
+
+import org.springframework.boot.SpringApplication;
+import org.springframework.boot.autoconfigure.SpringBootApplication;
+
+@SpringBootApplication
+public class DemoApplication {
+    public static void main(String[] args) {
+        SpringApplication.run(DemoApplication.class, args);
+    }
+}
+""",
+    # Create entity
+    "src/main/java/com/example/demo/entity/User.java": """package com.example.demo.entity;
+
+import jakarta.persistence.*;
+
+@Entity
+@Table(name = "users")
+public class User {
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    @Column(nullable = false, unique = true)
+    private String username;
+
+    public Long getId() {
+        return id;
+    }
+
+    public String getUsername() {
+        return username;
+    }
+}
+""",
+    # Create repository
+    "src/main/java/com/example/demo/repository/UserRepository.java": """package com.example.demo.repository;
+
+import com.example.demo.entity.User;
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.stereotype.Repository;
+
+import java.util.Optional;
+
+@Repository
+public interface UserRepository extends JpaRepository<User, Long> {
+    Optional<User> findByUsername(String username);
+    boolean existsByUsername(String username);
+    boolean existsByEmail(String email);
+}
+""",
+    # Create controller
+    "src/main/java/com/example/demo/controller/UserController.java": """package com.example.demo.controller;
+
+import com.example.demo.entity.User;
+import com.example.demo.repository.UserRepository;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.access.prepost.PreAuthorize;
+import org.springframework.web.bind.annotation.*;
+
+import java.util.List;
+
+@RestController
+@RequestMapping("/api/users")
+public class UserController {
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @GetMapping
+    @PreAuthorize("hasRole('ADMIN')")
+    public List<User> getAllUsers() {
+        return userRepository.findAll();
+    }
+
+    @GetMapping("/{id}")
+    @PreAuthorize("hasRole('USER')")
+    public ResponseEntity<User> getUserById(@PathVariable Long id) {
+        return userRepository.findById(id)
+                .map(ResponseEntity::ok)
+                .orElse(ResponseEntity.notFound().build());
+    }
+}
+""",
+    # Create security config
+    "src/main/java/com/example/demo/config/SecurityConfig.java": """package com.example.demo.config;
+
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.security.config.annotation.method.configuration.EnableMethodSecurity;
+import org.springframework.security.config.annotation.web.builders.HttpSecurity;
+import org.springframework.security.config.annotation.web.configuration.EnableWebSecurity;
+import org.springframework.security.crypto.bcrypt.BCryptPasswordEncoder;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.security.web.SecurityFilterChain;
+
+@Configuration
+@EnableWebSecurity
+@EnableMethodSecurity
+public class SecurityConfig {
+
+    @Bean
+    public SecurityFilterChain securityFilterChain(HttpSecurity http) throws Exception {
+        http
+            .csrf().disable()
+            .authorizeHttpRequests(auth -> auth
+                .requestMatchers("/api/auth/**").permitAll()
+                .anyRequest().authenticated()
+            );
+        return http.build();
+    }
+
+    @Bean
+    public PasswordEncoder passwordEncoder() {
+        return new BCryptPasswordEncoder();
+    }
+}
+""",
+    # Create test
+    "src/test/java/com/example/demo/UserControllerTest.java": """package com.example.demo;
+
+import com.example.demo.controller.UserController;
+import com.example.demo.repository.UserRepository;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.test.web.servlet.MockMvc;
+
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+class UserControllerTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Test
+    void testGetAllUsers() throws Exception {
+        mockMvc.perform(get("/api/users"))
+                .andExpect(status().isOk());
+    }
+}
+""",
+    # Create README
+    "README.md": """# Spring Boot Demo
+
+A sample Spring Boot application.
+""",
+})
+
+
+@pytest.fixture(scope="session")
+def spring_template(tmp_path_factory):
+    """Create a minimal Spring Boot project structure (once per session)"""
+    return make_project(tmp_path_factory.mktemp("spring"), SPRING_PROJECT_FILES)
+
+
+@pytest.fixture
+def spring_project(spring_template, clone_project):
+    """Per-test copy of the session-scoped Spring Boot project"""
+    return clone_project(spring_template)
+
+
+@pytest.fixture(scope="session")
+def spring_analyzed_project(spring_template, session_clone_project):
+    """Copy of the Spring Boot project that spring_analysis runs against"""
+    return session_clone_project(spring_template)
+
+
+@pytest.fixture(scope="session")
+def spring_analyzer(spring_analyzed_project):
+    """Single ProjectAnalyzer shared by every test of the Spring Boot project"""
+    return ProjectAnalyzer(str(spring_analyzed_project))
+
+
+@pytest.fixture(scope="session")
+def spring_analysis(spring_analyzer, cached_analysis):
+    """analyze() result shared by every test that uses the default flags"""
+    return cached_analysis("spring", SPRING_PROJECT_FILES, spring_analyzer)
+
+
+@dataclass(frozen=True)
+class ProjectCase:
+    """Per-project expectations for TestProjectIntegration"""
+    name: str  # fixture prefix: <name>_project, <name>_analysis, ...
+    expected_lang: str
+    source_exts: Tuple[str, ...]
+    min_files: int
+    min_source_files: int
+    # analyze() on the React project is expected to report the decisions'
+    # confidence distribution
+    confidence_distribution: bool = False
+
+
+PROJECT_CASES = [
+    pytest.param(
+        ProjectCase("react", "typescript", (".ts", ".tsx"), min_files=4, min_source_files=1,
+                    confidence_distribution=True),
+        id="react",
+    ),
+    pytest.param(
+        ProjectCase("spring", "java", (".java",), min_files=5, min_source_files=5),
+        id="spring",
+    ),
+]
+
+
+# Stand-ins for the threat-model / tech-debt stage output; the real stages are
+# exercised by the per-stack modules (e.g. test_rails_integration.py).
+THREATS_STUB = {"total": 0, "critical": 0, "high": 0, "medium": 0, "low": 0, "threats": []}
+TECH_DEBT_STUB = {"total": 0, "p0": 0, "p1": 0, "p2": 0, "p3": 0, "items": []}
+
+
+@pytest.fixture
+def project_fixture(request, case):
+    """Look up the <case.name>_<suffix> fixture for the current project"""
+    return lambda suffix: request.getfixturevalue(f"{case.name}_{suffix}")
+
+
+@pytest.fixture
+def stubbed_analyzer(project_fixture, monkeypatch):
+    """
+    ProjectAnalyzer on a per-test project copy with the threat-model and
+    tech-debt analyses stubbed out.
+
+    Used by the tests that only check analyze() runs (or skips) those stages.
+    Threat modeling is stubbed in both, since threat_modeling.enabled in the
+    config forces it even when skip_threat_model is passed.
+    """
+    analyzer = ProjectAnalyzer(str(project_fixture("project")))
+    monkeypatch.setattr(analyzer.threat_modeler, "analyze", lambda *args, **kwargs: dict(THREATS_STUB))
+    monkeypatch.setattr(analyzer.tech_debt_detector, "scan", lambda *args, **kwargs: dict(TECH_DEBT_STUB))
+    return analyzer
+
+
+@pytest.mark.parametrize("case", PROJECT_CASES)
+class TestProjectIntegration:
+    """Integration tests for React/Express and Spring Boot project analysis"""
+
+    def test_analyze_basic_structure(self, project_fixture):
+        """Test that analyze() returns basic result structure"""
+        analysis = project_fixture("analysis")
+
+        # Verify basic structure
+        assert "analysis_id" in analysis
+        assert "timestamp" in analysis
+        assert "project_path" in analysis
+        assert "branch" in analysis
+        assert "scan" in analysis
+
+        # Verify project path
+        assert analysis["project_path"] == str(project_fixture("analyzed_project"))
+
+        # Verify timestamp format (ISO 8601 with Z)
+        assert analysis["timestamp"].endswith("Z")
+        assert "T" in analysis["timestamp"]
+
+    def test_branch_creation(self, project_fixture):
+        """Test that feature branch is created"""
+        project = project_fixture("project")
+        analyzer = ProjectAnalyzer(str(project))
+        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
+
+        # Verify branch info
+        assert "branch" in result
+        assert isinstance(result["branch"], dict)
+        assert "branch" in result["branch"]
+        assert "created" in result["branch"]
+
+        # Verify branch name format
+        branch_name = result["branch"]["branch"]
+        assert branch_name.startswith("feature/import-")
+
+        # Verify branch was created
+        assert result["branch"]["created"] is True
+
+        # Verify branch exists in git
+        assert branch_name in local_branches(project)
+
+    def test_directory_scan(self, case, project_fixture):
+        """Test directory scanning"""
+        # Verify scan results
+        scan = project_fixture("analysis")["scan"]
+
+        assert "total_files" in scan
+        assert "total_loc" in scan
+        assert "files_by_extension" in scan
+        assert scan["total_files"] >= case.min_files
+
+        # Should detect the project's source files
+        files_by_ext = scan["files_by_extension"]
+        source_exts = [ext for ext in case.source_exts if ext in files_by_ext]
+        assert source_exts
+        assert sum(files_by_ext[ext]["count"] for ext in source_exts) >= case.min_source_files
+        assert all(files_by_ext[ext]["loc"] > 0 for ext in source_exts)
+
+    def test_project_validation(self, project_fixture):
+        """Test project validation"""
+        assert project_fixture("analyzer").validate_project() is True
+
+    def test_language_detection(self, case, project_fixture):
+        """Test language detection"""
+        # Verify language detection
+        lang_analysis = project_fixture("analysis")["language_analysis"]
+
+        assert lang_analysis["primary_language"] == case.expected_lang
+        assert case.expected_lang in lang_analysis["languages"]
+        assert lang_analysis["languages"][case.expected_lang]["percentage"] > 50
+
+        # Verify framework detection
+        assert "frameworks" in lang_analysis
+        frameworks = lang_analysis["frameworks"]
+        assert "frontend" in frameworks or "backend" in frameworks
+
+    def test_decision_extraction(self, case, project_fixture):
+        """Test decision extraction"""
+        # Verify decisions extracted
+        decisions = project_fixture("analysis")["decisions"]
+
+        assert "count" in decisions
+        assert "decisions" in decisions
+
+        # Should have at least some decisions
+        assert decisions["count"] >= 0
+
+        if case.confidence_distribution:
+            # Verify confidence distribution structure
+            assert "confidence_distribution" in decisions
+            dist = decisions["confidence_distribution"]
+            assert "high" in dist
+            assert "medium" in dist
+            assert "low" in dist
+
+        # If decisions found, check structure
+        if decisions["count"] > 0:
+            decision = decisions["decisions"][0]
+            assert "id" in decision
+            assert decision["id"].startswith("ADR-INFERRED-")
+            assert "title" in decision
+            assert "category" in decision
+            assert "confidence" in decision
+            assert "evidence" in decision
+
+    def test_diagram_generation(self, project_fixture):
+        """Test diagram generation"""
+        # Verify diagrams generated
+        diagrams = project_fixture("analysis")["diagrams"]
+
+        assert "diagrams" in diagrams
+        assert isinstance(diagrams["diagrams"], list)
+
+        # Should have at least one diagram
+        if len(diagrams["diagrams"]) > 0:
+            diagram = diagrams["diagrams"][0]
+            assert "type" in diagram
+            assert "format" in diagram
+            assert "path" in diagram
+            assert diagram["format"] in ["mermaid", "dot"]
+
+    def test_threat_modeling(self, stubbed_analyzer):
+        """Test that analyze() runs threat modeling when not skipped"""
+        result = stubbed_analyzer.analyze(skip_threat_model=False, skip_tech_debt=True)
+
+        # analyze() may add normalized keys on top of the stage output
+        assert THREATS_STUB.items() <= result["threats"].items()
+        assert result["tech_debt"]["status"] == "skipped"
+
+    def test_tech_debt_detection(self, stubbed_analyzer):
+        """Test that analyze() runs tech debt detection when not skipped"""
+        result = stubbed_analyzer.analyze(skip_threat_model=True, skip_tech_debt=False)
+
+        # analyze() may add normalized keys on top of the stage output
+        assert TECH_DEBT_STUB.items() <= result["tech_debt"].items()
+
+    def test_documentation_generation(self, project_fixture):
+        """Test documentation generation"""
+        # Verify documentation generated
+        docs = project_fixture("analysis")["documentation"]
+
+        assert "adrs" in docs
+        assert "threat_model" in docs
+        assert "tech_debt_report" in docs
+        assert "import_report" in docs
+
+        # Check that files were generated
+        assert isinstance(docs["adrs"], list)
+        assert isinstance(docs["threat_model"], str)
+        assert isinstance(docs["tech_debt_report"], str)
+        assert isinstance(docs["import_report"], str)
@@ -5,34 +5,17 @@ Integration tests for Ruby on Rails project analysis.
 Tests the full sdlc-import workflow on a sample Ruby project.
 """
 
-import sys
 import pytest
-import tempfile
-from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".claude/lib/python"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+from integration_helpers import AnalysisView, encode_files, make_project, project_analyzer_cls
 
-from project_analyzer import ProjectAnalyzer
+pytestmark = pytest.mark.integration
 
 
-def create_file(path: Path, content: str):
-    """Helper to create file with content"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
-
-
-@pytest.fixture
-def rails_project():
-    """Create a minimal Ruby on Rails project structure"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-
-        # Create Gemfile
-        create_file(
-            project_path / "Gemfile",
-            """source 'https://rubygems.org'
+# Minimal Ruby on Rails project, {relative path: UTF-8 bytes}
+RAILS_PROJECT_FILES = encode_files({
+    # Create Gemfile
+    "Gemfile": """source 'https://rubygems.org'
 git_source(:github) { |repo| "https://github.com/#{repo}.git" }
 
 ruby '3.2.0'
@@ -61,13 +44,9 @@ group :test do
   gem 'shoulda-matchers', '~> 5.0'
   gem 'database_cleaner-active_record'
 end
-"""
-        )
-
-        # Create config/database.yml
-        create_file(
-            project_path / "config/database.yml",
-            """default: &default
+""",
+    # Create config/database.yml
+    "config/database.yml": """default: &default
   adapter: postgresql
   encoding: unicode
   pool: <%= ENV.fetch("RAILS_MAX_THREADS") { 5 } %>
@@ -87,13 +66,9 @@ test:
 production:
   <<: *default
   database: <%= ENV['DB_NAME'] || 'myapp_production' %>
-"""
-        )
-
-        # Create config/application.rb
-        create_file(
-            project_path / "config/application.rb",
-            """require_relative "boot"
+""",
+    # Create config/application.rb
+    "config/application.rb": """require_relative "boot"
 
 require "rails"
 require "active_model/railtie"
@@ -120,13 +95,9 @@ module MyApp
     end
   end
 end
-"""
-        )
-
-        # Create User model
-        create_file(
-            project_path / "app/models/user.rb",
-            """class User < ApplicationRecord
+""",
+    # Create User model
+    "app/models/user.rb": """class User < ApplicationRecord
   has_secure_password
 
   validates :email, presence: true, uniqueness: true
@@ -159,13 +130,9 @@ end
     nil
   end
 end
-"""
-        )
-
-        # Create Post model
-        create_file(
-            project_path / "app/models/post.rb",
-            """class Post < ApplicationRecord
+""",
+    # Create Post model
+    "app/models/post.rb": """class Post < ApplicationRecord
   belongs_to :user
 
   validates :title, presence: true, length: { maximum: 255 }
@@ -175,13 +142,9 @@ end
   scope :published, -> { where(published: true) }
   scope :recent, -> { order(created_at: :desc) }
 end
-"""
-        )
-
-        # Create migration
-        create_file(
-            project_path / "db/migrate/20240101000000_create_users.rb",
-            """class CreateUsers < ActiveRecord::Migration[7.1]
+""",
+    # Create migration
+    "db/migrate/20240101000000_create_users.rb": """class CreateUsers < ActiveRecord::Migration[7.1]
   def change
     create_table :users do |t|
       t.string :username, null: false
@@ -196,12 +159,8 @@ end
     add_index :users, :email, unique: true
   end
 end
-"""
-        )
-
-        create_file(
-            project_path / "db/migrate/20240101000001_create_posts.rb",
-            """class CreatePosts < ActiveRecord::Migration[7.1]
+""",
+    "db/migrate/20240101000001_create_posts.rb": """class CreatePosts < ActiveRecord::Migration[7.1]
   def change
     create_table :posts do |t|
       t.string :title, null: false
@@ -216,13 +175,9 @@ end
     add_index :posts, :created_at
   end
 end
-"""
-        )
-
-        # Create controllers
-        create_file(
-            project_path / "app/controllers/application_controller.rb",
-            """class ApplicationController < ActionController::API
+""",
+    # Create controllers
+    "app/controllers/application_controller.rb": """class ApplicationController < ActionController::API
   before_action :authenticate_user!
 
   private
@@ -243,12 +198,8 @@ end
     render json: { error: 'Forbidden' }, status: :forbidden unless current_user.admin?
   end
 end
-"""
-        )
-
-        create_file(
-            project_path / "app/controllers/users_controller.rb",
-            """class UsersController < ApplicationController
+""",
+    "app/controllers/users_controller.rb": """class UsersController < ApplicationController
   skip_before_action :authenticate_user!, only: [:create]
   before_action :authorize_admin!, only: [:index, :destroy]
   before_action :set_user, only: [:show, :update, :destroy]
@@ -295,12 +246,8 @@ end
     params.require(:user).permit(:username, :email, :password, :password_confirmation, :role)
   end
 end
-"""
-        )
-
-        create_file(
-            project_path / "app/controllers/authentication_controller.rb",
-            """class AuthenticationController < ApplicationController
+""",
+    "app/controllers/authentication_controller.rb": """class AuthenticationController < ApplicationController
   skip_before_action :authenticate_user!
 
   def login
@@ -313,25 +260,17 @@ end
     end
   end
 end
-"""
-        )
-
-        # Create routes
-        create_file(
-            project_path / "config/routes.rb",
-            """Rails.application.routes.draw do
+""",
+    # Create routes
+    "config/routes.rb": """Rails.application.routes.draw do
   post '/auth/login', to: 'authentication#login'
 
   resources :users
   resources :posts
 end
-"""
-        )
-
-        # Create tests
-        create_file(
-            project_path / "spec/models/user_spec.rb",
-            """require 'rails_helper'
+""",
+    # Create tests
+    "spec/models/user_spec.rb": """require 'rails_helper'
 
 RSpec.describe User, type: :model do
   describe 'validations' do
@@ -354,12 +293,8 @@ RSpec.describe User, type: :model do
     end
   end
 end
-"""
-        )
-
-        create_file(
-            project_path / "spec/requests/users_spec.rb",
-            """require 'rails_helper'
+""",
+    "spec/requests/users_spec.rb": """require 'rails_helper'
 
 RSpec.describe 'Users API', type: :request do
   describe 'POST /users' do
@@ -380,57 +315,82 @@ RSpec.describe 'Users API', type: :request do
     end
   end
 end
-"""
-        )
-
-        # Create README
-        create_file(
-            project_path / "README.md",
-            """# Rails API
+""",
+    # Create README
+    "README.md": """# Rails API
 
 A sample Ruby on Rails API application.
-"""
-        )
+""",
+})
+
+
+@pytest.fixture(scope="session")
+def rails_template(tmp_path_factory):
+    """Create a minimal Ruby on Rails project structure (once per session)"""
+    return make_project(tmp_path_factory.mktemp("rails"), RAILS_PROJECT_FILES)
+
+
+@pytest.fixture(scope="session")
+def rails_analyzed_project(rails_template, session_clone_project):
+    """Copy of the Rails project that rails_analysis runs against"""
+    return session_clone_project(rails_template)
+
+
+@pytest.fixture(scope="session")
+def rails_analyzer(rails_analyzed_project):
+    """Single ProjectAnalyzer shared by every test of the Rails project"""
+    return project_analyzer_cls()(str(rails_analyzed_project))
+
+
+@pytest.fixture(scope="session")
+def rails_analysis(rails_analyzer):
+    """analyze() result shared by every test that uses the default flags"""
+    return rails_analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
+
+
+@pytest.fixture(scope="session")
+def rails_threats_analysis(rails_template, session_clone_project):
+    """analyze() result with the threat model enabled (own project copy)"""
+    project_path = session_clone_project(rails_template)
+    return project_analyzer_cls()(str(project_path)).analyze(
+        skip_threat_model=False, skip_tech_debt=True
+    )
+
+
+@pytest.fixture(scope="session")
+def rails_tech_debt_analysis(rails_template, session_clone_project):
+    """analyze() result with tech debt detection enabled (own project copy)"""
+    project_path = session_clone_project(rails_template)
+    return project_analyzer_cls()(str(project_path)).analyze(
+        skip_threat_model=True, skip_tech_debt=False
+    )
 
-        # Initialize git
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=str(project_path), check=True, capture_output=True)
 
-        yield project_path
+@pytest.fixture(scope="session")
+def rails(rails_analysis):
+    """Cached rails_analysis with its scan / language sections pre-extracted"""
+    return AnalysisView.of(rails_analysis)
 
 
 class TestRailsIntegration:
     """Integration tests for Ruby on Rails project analysis"""
 
-    def test_analyze_basic_structure(self, rails_project):
+    def test_analyze_basic_structure(self, rails, rails_analyzed_project):
         """Test that analyze() returns basic result structure"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
+        assert "analysis_id" in rails.result
+        assert "timestamp" in rails.result
+        assert "project_path" in rails.result
+        assert rails.result["project_path"] == str(rails_analyzed_project)
 
-        assert "analysis_id" in result
-        assert "timestamp" in result
-        assert "project_path" in result
-        assert result["project_path"] == str(rails_project)
-
-    def test_branch_creation_rails(self, rails_project):
+    def test_branch_creation_rails(self, rails):
         """Test that feature branch is created"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        branch_name = result["branch"]["branch"]
+        branch_name = rails.result["branch"]["branch"]
         assert branch_name.startswith("feature/import-")
-        assert result["branch"]["created"] is True
+        assert rails.result["branch"]["created"] is True
 
-    def test_directory_scan_rails(self, rails_project):
+    def test_directory_scan_rails(self, rails):
         """Test directory scanning"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        scan = result["scan"]
+        scan = rails.scan
         assert scan["total_files"] >= 5
         assert ".rb" in scan["files_by_extension"]
 
@@ -438,62 +398,43 @@ class TestRailsIntegration:
         assert rb_info["count"] >= 5
         assert rb_info["loc"] > 0
 
-    def test_project_validation_rails(self, rails_project):
+    def test_project_validation_rails(self, rails_analyzer):
         """Test project validation"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        assert analyzer.validate_project() is True
+        assert rails_analyzer.validate_project() is True
 
-    def test_language_detection_rails(self, rails_project):
+    def test_language_detection_rails(self, rails):
         """Test language detection"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        lang_analysis = result["language_analysis"]
+        lang_analysis = rails.lang
         assert lang_analysis["primary_language"] == "ruby"
         assert "ruby" in lang_analysis["languages"]
         assert lang_analysis["languages"]["ruby"]["percentage"] > 50
 
-    def test_decision_extraction_rails(self, rails_project):
+    def test_decision_extraction_rails(self, rails):
         """Test decision extraction"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        decisions = result["decisions"]
+        decisions = rails.result["decisions"]
         assert "count" in decisions
         assert decisions["count"] >= 0
 
-    def test_diagram_generation_rails(self, rails_project):
+    def test_diagram_generation_rails(self, rails):
         """Test diagram generation"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        diagrams = result["diagrams"]
+        diagrams = rails.result["diagrams"]
         assert isinstance(diagrams["diagrams"], list)
 
-    def test_threat_modeling_rails(self, rails_project):
+    def test_threat_modeling_rails(self, rails_threats_analysis):
         """Test threat modeling"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=False, skip_tech_debt=True)
-
-        threats = result["threats"]
+        threats = rails_threats_analysis["threats"]
         if "status" in threats:
             assert threats["status"] != "skipped"
 
-    def test_tech_debt_detection_rails(self, rails_project):
+    def test_tech_debt_detection_rails(self, rails_tech_debt_analysis):
         """Test tech debt detection"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=False)
-
-        tech_debt = result["tech_debt"]
+        tech_debt = rails_tech_debt_analysis["tech_debt"]
         if "status" in tech_debt:
             assert tech_debt["status"] != "skipped"
 
-    def test_documentation_generation_rails(self, rails_project):
+    def test_documentation_generation_rails(self, rails):
         """Test documentation generation"""
-        analyzer = ProjectAnalyzer(str(rails_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        docs = result["documentation"]
+        docs = rails.result["documentation"]
         assert isinstance(docs["adrs"], list)
         assert isinstance(docs["threat_model"], str)
         assert isinstance(docs["tech_debt_report"], str)
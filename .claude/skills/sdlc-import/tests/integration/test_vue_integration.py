@@ -5,34 +5,18 @@ Integration tests for Vue.js project analysis.
 Tests the full sdlc-import workflow on a sample Vue.js project.
 """
 
-import sys
 import pytest
-import tempfile
-from pathlib import Path
-
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".claude/lib/python"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from project_analyzer import ProjectAnalyzer
+from integration_helpers import encode_files, make_project
 
+pytestmark = pytest.mark.integration
 
-def create_file(path: Path, content: str):
-    """Helper to create file with content"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
-
-
-@pytest.fixture
-def vue_project():
-    """Create a minimal Vue.js project structure"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
 
-        # Create package.json
-        create_file(
-            project_path / "package.json",
-            """{
+# Minimal Vue.js project, {relative path: UTF-8 bytes}
+VUE_PROJECT_FILES = encode_files({
+    # Create package.json
+    "package.json": """{
   "name": "my-vue-app",
   "version": "0.1.0",
   "private": true,
@@ -51,25 +35,17 @@ def vue_project():
     "vite": "^4.4.9"
   }
 }
-"""
-        )
-
-        # Create vite.config.js
-        create_file(
-            project_path / "vite.config.js",
-            """import { defineConfig } from 'vite'
+""",
+    # Create vite.config.js
+    "vite.config.js": """import { defineConfig } from 'vite'
 import vue from '@vitejs/plugin-vue'
 
 export default defineConfig({
   plugins: [vue()],
 })
-"""
-        )
-
-        # Create main.js
-        create_file(
-            project_path / "src/main.js",
-            """import { createApp } from 'vue'
+""",
+    # Create main.js
+    "src/main.js": """import { createApp } from 'vue'
 import { createPinia } from 'pinia'
 import App from './App.vue'
 import router from './router'
@@ -80,13 +56,9 @@ app.use(createPinia())
 app.use(router)
 
 app.mount('#app')
-"""
-        )
-
-        # Create App.vue
-        create_file(
-            project_path / "src/App.vue",
-            """<template>
+""",
+    # Create App.vue
+    "src/App.vue": """<template>
   <div id="app">
     <nav>
       <router-link to="/">Home</router-link> |
@@ -114,13 +86,9 @@ nav a {
   color: #2c3e50;
 }
 </style>
-"""
-        )
-
-        # Create Home view
-        create_file(
-            project_path / "src/views/HomeView.vue",
-            """<template>
+""",
+    # Create Home view
+    "src/views/HomeView.vue": """<template>
   <div class="home">
     <h1>{{ title }}</h1>
     <p>{{ message }}</p>
@@ -146,13 +114,9 @@ const increment = () => {
   margin-top: 50px;
 }
 </style>
-"""
-        )
-
-        # Create router
-        create_file(
-            project_path / "src/router/index.js",
-            """import { createRouter, createWebHistory } from 'vue-router'
+""",
+    # Create router
+    "src/router/index.js": """import { createRouter, createWebHistory } from 'vue-router'
 import HomeView from '../views/HomeView.vue'
 
 const router = createRouter({
@@ -172,13 +136,9 @@ const router = createRouter({
 })
 
 export default router
-"""
-        )
-
-        # Create Pinia store
-        create_file(
-            project_path / "src/stores/counter.js",
-            """import { ref, computed } from 'vue'
+""",
+    # Create Pinia store
+    "src/stores/counter.js": """import { ref, computed } from 'vue'
 import { defineStore } from 'pinia'
 
 export const useCounterStore = defineStore('counter', () => {
@@ -191,96 +151,77 @@ export const useCounterStore = defineStore('counter', () => {
 
   return { count, doubleCount, increment }
 })
-"""
-        )
-
-        create_file(
-            project_path / "README.md",
-            """# My Vue App
+""",
+    "README.md": """# My Vue App
 
 A Vue.js 3 application using Composition API.
-"""
-        )
+""",
+})
+
+
+@pytest.fixture(scope="session")
+def vue_template(tmp_path_factory):
+    """Create a minimal Vue.js project structure (once per session)"""
+    return make_project(tmp_path_factory.mktemp("vue"), VUE_PROJECT_FILES)
 
-        # Initialize git (required for analyze())
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_path), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=str(project_path), check=True, capture_output=True)
 
-        yield project_path
+@pytest.fixture(scope="session")
+def vue_analyzed_project(vue_template, session_clone_project):
+    """Copy of the Vue.js project that vue_analysis runs against"""
+    return session_clone_project(vue_template)
+
+
+@pytest.fixture(scope="session")
+def vue_analysis(vue_analyzed_project):
+    """analyze() result shared by every test of the Vue.js project"""
+    return ProjectAnalyzer(str(vue_analyzed_project)).analyze(skip_threat_model=True, skip_tech_debt=True)
 
 
 class TestVueIntegration:
     """Integration tests for Vue.js project analysis"""
 
-    def test_analyze_basic_structure(self, vue_project):
+    def test_analyze_basic_structure(self, vue_analysis):
         """Test that analyze() returns basic result structure"""
-        analyzer = ProjectAnalyzer(str(vue_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
         # Verify basic structure
-        assert "analysis_id" in result
-        assert "timestamp" in result
-        assert "project_path" in result
-        assert "branch" in result
-        assert "scan" in result
+        assert "analysis_id" in vue_analysis
+        assert "timestamp" in vue_analysis
+        assert "project_path" in vue_analysis
+        assert "branch" in vue_analysis
+        assert "scan" in vue_analysis
 
-    def test_language_detection_javascript(self, vue_project):
+    def test_language_detection_javascript(self, vue_analysis):
         """Test JavaScript language detection"""
-        analyzer = ProjectAnalyzer(str(vue_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
         # Verify language detection
-        assert "language_analysis" in result
-        lang_analysis = result["language_analysis"]
+        assert "language_analysis" in vue_analysis
+        lang_analysis = vue_analysis["language_analysis"]
 
         assert "primary_language" in lang_analysis
         # Primary language should be JavaScript
         assert lang_analysis["primary_language"] in ["javascript", "vue"]
 
-    def test_vue_framework_detection(self, vue_project):
-        """Test Vue.js framework detection"""
-        analyzer = ProjectAnalyzer(str(vue_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
+    @pytest.mark.parametrize("category,framework", [
+        ("frontend", "vue"),
+        ("build_tools", "vite"),
+    ])
+    def test_framework_detection(self, vue_analysis, category, framework):
+        """Test Vue.js framework and Vite build tool detection"""
         # Verify framework detection
-        assert "language_analysis" in result
-        frameworks = result["language_analysis"]["frameworks"]
-
-        # Vue should be detected as frontend framework
-        assert "frontend" in frameworks
-        frontend_frameworks = [f.lower() for f in frameworks["frontend"]]
-        assert "vue" in frontend_frameworks
-
-    def test_vite_build_tool_detection(self, vue_project):
-        """Test Vite build tool detection"""
-        analyzer = ProjectAnalyzer(str(vue_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
-        # Verify build tool detection
-        frameworks = result["language_analysis"]["frameworks"]
-
-        # Vite should be detected as build tool
-        assert "build_tools" in frameworks
-        build_tools = [f.lower() for f in frameworks["build_tools"]]
-        assert "vite" in build_tools
-
-    def test_file_count_vue(self, vue_project):
-        """Test that Vue files are counted correctly"""
-        analyzer = ProjectAnalyzer(str(vue_project))
-        result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
-
+        assert "language_analysis" in vue_analysis
+        frameworks = vue_analysis["language_analysis"]["frameworks"]
+
+        # Vue should be detected as frontend framework, Vite as build tool
+        assert category in frameworks
+        detected = [f.lower() for f in frameworks[category]]
+        assert framework in detected
+
+    @pytest.mark.parametrize("extension,min_count", [
+        (".vue", 2),
+        (".js", 3),
+    ])
+    def test_file_count_vue(self, vue_analysis, extension, min_count):
+        """Test that Vue and JavaScript files are counted correctly"""
         # Verify scan results
-        scan = result["scan"]
-        files_by_ext = scan["files_by_extension"]
-
-        # Should detect .vue files
-        assert ".vue" in files_by_ext
-        assert files_by_ext[".vue"]["count"] >= 2
+        files_by_ext = vue_analysis["scan"]["files_by_extension"]
 
-        # Should detect .js files
-        assert ".js" in files_by_ext
-        assert files_by_ext[".js"]["count"] >= 3
+        assert extension in files_by_ext
+        assert files_by_ext[extension]["count"] >= min_count
@@ -10,8 +10,8 @@ Tests:
 
 import sys
 from pathlib import Path
+import pytest
 import yaml
-import tempfile
 import shutil
 
 # Add scripts to path
@@ -20,8 +20,56 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from graph_generator import GraphGenerator
 from documentation_generator import DocumentationGenerator
 
+# libyaml-backed loader when PyYAML was built with it; same results as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def test_graph_generator_version_path():
+
+@pytest.fixture(scope="module")
+def version_file(repo_root):
+    """The framework's .claude/VERSION file"""
+    return repo_root / ".claude" / "VERSION"
+
+
+@pytest.fixture(scope="module")
+def expected_version(version_file):
+    """Version from VERSION, parsed once; None when the file is missing (asserted on in the tests)"""
+    if not version_file.exists():
+        return None
+    return yaml.safe_load(version_file.read_text())['version']
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """Temp directory shared by this module's tests (one cleanup for all)"""
+    return tmp_path_factory.mktemp("v224")
+
+
+@pytest.fixture
+def output_dir(shared_tmp, request):
+    """Fresh .project directory for one test, under shared_tmp"""
+    output_dir = shared_tmp / request.node.name / ".project"
+    output_dir.mkdir(parents=True)
+    return output_dir
+
+
+@pytest.fixture(scope="module")
+def doc_gen(shared_tmp):
+    """
+    DocumentationGenerator shared by this module's tests.
+
+    Construction (VERSION load, Jinja2 environment) is invariant; each test
+    points output_dir at its own .project directory before generating.
+    """
+    config = {
+        'project_path': str(shared_tmp),
+        'general': {
+            'output_dir': '.project'
+        }
+    }
+    return DocumentationGenerator(config)
+
+
+def test_graph_generator_version_path(version_file, expected_version):
     """
     C1: Verify graph generator finds VERSION file at correct path.
 
@@ -40,51 +88,32 @@ def test_graph_generator_version_path():
     assert version != "unknown", "Version should not be 'unknown'"
 
     # Should match current version in VERSION file
-    # Path from test file: tests/ -> sdlc-import/ -> skills/ -> .claude/ -> repo root
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent.parent
-    version_file = repo_root / ".claude" / "VERSION"
     assert version_file.exists(), f"VERSION file not found at {version_file}"
-
-    version_data = yaml.safe_load(version_file.read_text())
-    expected_version = version_data['version']
     assert version == expected_version, f"Version mismatch: {version} != {expected_version}"
 
 
-def test_documentation_generator_version_loading():
+def test_documentation_generator_version_loading(doc_gen, expected_version):
     """
     G2: Verify documentation generator loads version dynamically.
 
     Expected: framework_version is loaded from VERSION file, not hardcoded.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = {
-            'project_path': tmpdir,
-            'general': {
-                'output_dir': '.project'
-            }
-        }
-
-        gen = DocumentationGenerator(config)
-
-        # Version should be loaded and valid
-        assert hasattr(gen, 'framework_version'), "DocumentationGenerator should have framework_version attribute"
-        assert gen.framework_version, "Version should not be empty"
-        assert gen.framework_version != "v1.0.0", "Version should not be hardcoded v1.0.0"
+    gen = doc_gen
 
-        # Should match VERSION file (may have 'v' prefix added)
-        repo_root = Path(__file__).resolve().parent.parent.parent.parent.parent
-        version_file = repo_root / ".claude" / "VERSION"
-        version_data = yaml.safe_load(version_file.read_text())
-        expected_version = version_data['version']
+    # Version should be loaded and valid
+    assert hasattr(gen, 'framework_version'), "DocumentationGenerator should have framework_version attribute"
+    assert gen.framework_version, "Version should not be empty"
+    assert gen.framework_version != "v1.0.0", "Version should not be hardcoded v1.0.0"
 
-        # Doc generator adds 'v' prefix if missing
-        if not expected_version.startswith('v'):
-            expected_version = f'v{expected_version}'
+    # Should match VERSION file (may have 'v' prefix added)
+    # Doc generator adds 'v' prefix if missing
+    if not expected_version.startswith('v'):
+        expected_version = f'v{expected_version}'
 
-        assert gen.framework_version == expected_version, f"Version mismatch: {gen.framework_version} != {expected_version}"
+    assert gen.framework_version == expected_version, f"Version mismatch: {gen.framework_version} != {expected_version}"
 
 
-def test_adr_yaml_validity():
+def test_adr_yaml_validity(doc_gen, output_dir):
     """
     C3: Verify generated ADRs have valid YAML without alternatives_considered.
 
@@ -92,149 +121,119 @@ def test_adr_yaml_validity():
     - ADRs without alternatives_considered parse successfully
     - YAML validation catches invalid structures
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = {
-            'project_path': tmpdir,
-            'general': {
-                'output_dir': '.project'
-            }
-        }
-
-        gen = DocumentationGenerator(config)
-
-        # Test decision without problematic field
-        decision = {
-            "id": "ADR-TEST-001",
-            "title": "Test Decision",
-            "status": "accepted",
-            "date": "2026-01-28",
-            "context": "Test context for decision",
-            "decision": "We decided to use approach X",
-            "consequences": {
-                "positive": ["Benefit 1"],
-                "negative": ["Trade-off 1"]
-            }
+    gen = doc_gen
+
+    # Test decision without problematic field
+    decision = {
+        "id": "ADR-TEST-001",
+        "title": "Test Decision",
+        "status": "accepted",
+        "date": "2026-01-28",
+        "context": "Test context for decision",
+        "decision": "We decided to use approach X",
+        "consequences": {
+            "positive": ["Benefit 1"],
+            "negative": ["Trade-off 1"]
         }
+    }
 
-        # Generate ADRs (should succeed)
-        decisions = {"decisions": [decision]}
-        output_dir = Path(tmpdir) / ".project"
-        output_dir.mkdir(parents=True)
-        gen.output_dir = output_dir
+    # Generate ADRs (should succeed)
+    decisions = {"decisions": [decision]}
+    gen.output_dir = output_dir
 
-        adrs = gen._generate_adrs(decisions)
+    adrs = gen._generate_adrs(decisions)
 
-        # Verify file was created
-        assert len(adrs) == 1, f"Expected 1 ADR, got {len(adrs)}"
+    # Verify file was created
+    assert len(adrs) == 1, f"Expected 1 ADR, got {len(adrs)}"
 
-        # Verify YAML is valid
-        adr_file = Path(adrs[0])
-        assert adr_file.exists(), f"ADR file not created: {adr_file}"
+    # Verify YAML is valid
+    adr_file = Path(adrs[0])
+    assert adr_file.exists(), f"ADR file not created: {adr_file}"
 
-        adr_content = adr_file.read_text()
-        parsed = yaml.safe_load(adr_content)
+    adr_content = adr_file.read_text()
+    parsed = yaml.load(adr_content, Loader=_YAML_LOADER)
 
-        # Verify structure
-        assert parsed['id'] == "ADR-TEST-001"
-        assert 'alternatives_considered' not in parsed, "alternatives_considered should be removed"
+    # Verify structure
+    assert parsed['id'] == "ADR-TEST-001"
+    assert 'alternatives_considered' not in parsed, "alternatives_considered should be removed"
 
 
-def test_adr_alternatives_considered_removal():
+def test_adr_alternatives_considered_removal(doc_gen, output_dir):
     """
     C3: Verify alternatives_considered field is removed from decisions.
 
     Expected: Field is removed before YAML generation.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = {
-            'project_path': tmpdir,
-            'general': {
-                'output_dir': '.project'
-            }
-        }
-
-        gen = DocumentationGenerator(config)
-
-        # Test decision WITH problematic field
-        decision = {
-            "id": "ADR-TEST-002",
-            "title": "Test Decision with Alternatives",
-            "status": "accepted",
-            "date": "2026-01-28",
-            "context": "Test context",
-            "decision": "Decision text",
-            "consequences": {
-                "positive": ["Benefit"],
-                "negative": ["Trade-off"]
-            },
-            # Problematic field (nested list structure)
-            "alternatives_considered": [
-                "Option A",
-                ["Sub-option 1", "Sub-option 2"]  # Invalid YAML structure
-            ]
-        }
+    gen = doc_gen
+
+    # Test decision WITH problematic field
+    decision = {
+        "id": "ADR-TEST-002",
+        "title": "Test Decision with Alternatives",
+        "status": "accepted",
+        "date": "2026-01-28",
+        "context": "Test context",
+        "decision": "Decision text",
+        "consequences": {
+            "positive": ["Benefit"],
+            "negative": ["Trade-off"]
+        },
+        # Problematic field (nested list structure)
+        "alternatives_considered": [
+            "Option A",
+            ["Sub-option 1", "Sub-option 2"]  # Invalid YAML structure
+        ]
+    }
 
-        # Generate ADRs
-        decisions = {"decisions": [decision]}
-        output_dir = Path(tmpdir) / ".project"
-        output_dir.mkdir(parents=True)
-        gen.output_dir = output_dir
+    # Generate ADRs
+    decisions = {"decisions": [decision]}
+    gen.output_dir = output_dir
 
-        adrs = gen._generate_adrs(decisions)
+    adrs = gen._generate_adrs(decisions)
 
-        # Verify YAML is valid (should not raise)
-        adr_file = Path(adrs[0])
-        adr_content = adr_file.read_text()
-        parsed = yaml.safe_load(adr_content)  # Should parse without error
+    # Verify YAML is valid (should not raise)
+    adr_file = Path(adrs[0])
+    adr_content = adr_file.read_text()
+    parsed = yaml.load(adr_content, Loader=_YAML_LOADER)  # Should parse without error
 
-        # Verify problematic field was removed
-        assert 'alternatives_considered' not in parsed
+    # Verify problematic field was removed
+    assert 'alternatives_considered' not in parsed
 
 
-def test_version_in_import_report():
+def test_version_in_import_report(doc_gen, output_dir):
     """
     G2: Verify import report includes framework version in header.
 
     Expected: Report header shows "SDLC Import Report - vX.Y.Z"
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = {
-            'project_path': tmpdir,
-            'general': {
-                'output_dir': '.project'
-            }
-        }
-
-        gen = DocumentationGenerator(config)
-
-        # Mock analysis results
-        analysis_results = {
-            'analysis_id': 'test-123',
-            'language_analysis': {'primary_language': 'Python'},
-            'decisions': {'count': 5},
-            'threats': {'total': 3},
-            'tech_debt': {'total': 10}
-        }
+    gen = doc_gen
+
+    # Mock analysis results
+    analysis_results = {
+        'analysis_id': 'test-123',
+        'language_analysis': {'primary_language': 'Python'},
+        'decisions': {'count': 5},
+        'threats': {'total': 3},
+        'tech_debt': {'total': 10}
+    }
 
-        # Generate report
-        output_dir = Path(tmpdir) / ".project"
-        output_dir.mkdir(parents=True)
-        gen.output_dir = output_dir
+    # Generate report
+    gen.output_dir = output_dir
 
-        report_path = gen._generate_import_report(analysis_results)
+    report_path = gen._generate_import_report(analysis_results)
 
-        # Verify report exists
-        report_file = Path(report_path)
-        assert report_file.exists(), f"Report not created: {report_file}"
+    # Verify report exists
+    report_file = Path(report_path)
+    assert report_file.exists(), f"Report not created: {report_file}"
 
-        # Verify header includes version
-        report_content = report_file.read_text()
-        assert "SDLC Import Report" in report_content, "Report should have SDLC Import Report header"
-        assert gen.framework_version in report_content, f"Report should include version {gen.framework_version}"
+    # Verify header includes version
+    report_content = report_file.read_text()
+    assert "SDLC Import Report" in report_content, "Report should have SDLC Import Report header"
+    assert gen.framework_version in report_content, f"Report should include version {gen.framework_version}"
 
-        # Verify version is in first line (header)
-        first_line = report_content.split('\n')[0]
-        assert gen.framework_version in first_line, f"Version should be in header: {first_line}"
+    # Verify version is in first line (header)
+    first_line = report_content.split('\n')[0]
+    assert gen.framework_version in first_line, f"Version should be in header: {first_line}"
 
 
 if __name__ == "__main__":
@@ -1,16 +1,34 @@
 import pytest
-from pathlib import Path
-import sys
-
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from adr_validator import ADRValidator
 
 
+@pytest.fixture(scope="module")
+def empty_project(tmp_path_factory):
+    """Empty project directory shared by the tests that create no files (validate() only reads)"""
+    return tmp_path_factory.mktemp("empty_project")
+
+
+@pytest.fixture(scope="module")
+def rls_project(tmp_path_factory):
+    """Project with one EF Core migration enabling PostgreSQL RLS (read-only, shared)"""
+    project_path = tmp_path_factory.mktemp("rls_project")
+    migration_file = project_path / "Migrations" / "AddRLS.cs"
+    migration_file.parent.mkdir()
+    migration_file.write_text("""
+        migrationBuilder.Sql(@"
+            ALTER TABLE users ENABLE ROW LEVEL SECURITY;
+            CREATE POLICY tenant_isolation ON users FOR ALL TO PUBLIC
+            USING (tenant_id = current_setting('app.tenant_id')::uuid);
+        ");
+    """)
+    return project_path
+
+
 class TestADRValidator:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def validator(self):
+        # Stateless after __init__ (config + rules YAML), so one per module
         config = {"adr_validation": {"enabled": True}}
         return ADRValidator(config)
 
@@ -64,19 +82,8 @@ class TestADRValidator:
         assert claim_result['actual_coverage'] < claim_result['claimed_coverage']
         assert claim_result['confidence'] < 0.5
 
-    def test_rls_technology_validation_success(self, validator, tmp_path):
+    def test_rls_technology_validation_success(self, validator, rls_project):
         """Test successful RLS technology validation"""
-        # Create migration with RLS
-        migration_file = tmp_path / "Migrations" / "AddRLS.cs"
-        migration_file.parent.mkdir(parents=True)
-        migration_file.write_text("""
-            migrationBuilder.Sql(@"
-                ALTER TABLE users ENABLE ROW LEVEL SECURITY;
-                CREATE POLICY tenant_isolation ON users FOR ALL TO PUBLIC
-                USING (tenant_id = current_setting('app.tenant_id')::uuid);
-            ");
-        """)
-
         # ADR claiming RLS usage
         adr = {
             "id": "ADR-TEST-002",
@@ -84,14 +91,14 @@ class TestADRValidator:
             "decision": "Uses PostgreSQL Row-Level Security for tenant isolation"
         }
 
-        result = validator.validate(tmp_path, [adr])
+        result = validator.validate(rls_project, [adr])
         claim_result = result['results'][0]['claims'][0]
 
         assert claim_result['is_valid'] is True
         assert claim_result['confidence'] >= 0.9
         assert len(claim_result['evidence_files']) > 0
 
-    def test_rls_technology_validation_failure(self, validator, tmp_path):
+    def test_rls_technology_validation_failure(self, validator, empty_project):
         """Test failed RLS technology validation (no RLS implementation)"""
         adr = {
             "id": "ADR-TEST-003",
@@ -99,7 +106,7 @@ class TestADRValidator:
             "decision": "Uses Row-Level Security"
         }
 
-        result = validator.validate(tmp_path, [adr])
+        result = validator.validate(empty_project, [adr])
         claim_result = result['results'][0]['claims'][0]
 
         assert claim_result['is_valid'] is False
@@ -203,15 +210,15 @@ class TestADRValidator:
         assert claims[0]['type'] == 'coverage'
         assert claims[1]['type'] == 'technology'
 
-    def test_empty_adr_list(self, validator, tmp_path):
+    def test_empty_adr_list(self, validator, empty_project):
         """Test validation with no ADRs"""
-        result = validator.validate(tmp_path, [])
+        result = validator.validate(empty_project, [])
 
         assert result['summary']['total_adrs'] == 0
         assert result['summary']['total_claims'] == 0
         assert result['summary']['validation_rate'] == 0
 
-    def test_adr_without_claims(self, validator, tmp_path):
+    def test_adr_without_claims(self, validator, empty_project):
         """Test ADR that makes no validatable claims"""
         adr = {
             "id": "ADR-004",
@@ -219,26 +226,21 @@ class TestADRValidator:
             "decision": "We chose PostgreSQL as our database"
         }
 
-        result = validator.validate(tmp_path, [adr])
+        result = validator.validate(empty_project, [adr])
 
         adr_result = result['results'][0]
         assert adr_result['claims_count'] == 0
         assert adr_result['validated_count'] == 0
 
-    def test_disabled_validation(self, tmp_path):
+    def test_disabled_validation(self):
         """Test that disabled validation skips processing"""
         config = {"adr_validation": {"enabled": False}}
         validator = ADRValidator(config)
         assert validator.enabled is False
 
-    def test_validation_summary_statistics(self, validator, tmp_path):
+    def test_validation_summary_statistics(self, validator, rls_project):
         """Test overall validation statistics"""
-        # Create RLS implementation
-        migration_file = tmp_path / "Migrations" / "AddRLS.cs"
-        migration_file.parent.mkdir(parents=True)
-        migration_file.write_text("ALTER TABLE users ENABLE ROW LEVEL SECURITY;")
-
-        # Multiple ADRs with claims
+        # Multiple ADRs with claims (RLS implemented, LGPD not)
         adrs = [
             {
                 "id": "ADR-001",
@@ -250,7 +252,7 @@ class TestADRValidator:
             }
         ]
 
-        result = validator.validate(tmp_path, adrs)
+        result = validator.validate(rls_project, adrs)
 
         assert result['summary']['total_adrs'] == 2
         assert result['summary']['total_claims'] == 2
@@ -3,34 +3,51 @@
 Unit tests for architecture_visualizer.py
 """
 
-import sys
+import json
 import pytest
-import tempfile
+from types import MappingProxyType
 from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".claude/lib/python"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-
 from architecture_visualizer import ArchitectureVisualizer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
-    """Default config for visualizer"""
-    return {
-        "general": {
+    """Default config for visualizer (read-only, shared by the module)"""
+    return MappingProxyType({
+        "general": MappingProxyType({
             "output_dir": ".project"
-        }
-    }
+        })
+    })
+
+
+@pytest.fixture(scope="module")
+def viz_cache(tmp_path_factory):
+    """
+    Factory returning (visualizer, generate() result) for the given inputs.
+
+    Results are cached per distinct (language_analysis, decisions) pair, so
+    tests sharing an input shape share one generate() run and its files.
+    Tests must not modify the generated files.
+    """
+    cache = {}
+
+    def run(language_analysis, decisions):
+        key = (json.dumps(language_analysis, sort_keys=True), json.dumps(decisions, sort_keys=True))
+        if key not in cache:
+            tmp = tmp_path_factory.mktemp("viz")
+            visualizer = ArchitectureVisualizer({"general": {"output_dir": str(tmp / ".agentic_sdlc")}})
+            result = visualizer.generate(tmp, language_analysis, decisions)
+            cache[key] = (visualizer, result)
+        return cache[key]
+
+    return run
 
 
-@pytest.fixture
-def temp_project():
-    """Create temporary project directory"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-        yield project_path
+@pytest.fixture(scope="module")
+def default_generated(viz_cache):
+    """Visualizer and generate() result for an empty project (no components)"""
+    return viz_cache({}, {"decisions": []})
 
 
 class TestArchitectureVisualizer:
@@ -50,173 +67,90 @@ class TestArchitectureVisualizer:
 
         assert visualizer.output_dir == Path("/custom/path/architecture")
 
-    def test_generate_creates_output_dir(self, config, temp_project):
+    def test_generate_creates_output_dir(self, default_generated):
         """Test that generate() creates output directory"""
-        # Use temp_project as output dir
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        result = visualizer.generate(temp_project, {}, {"decisions": []})
+        visualizer, result = default_generated
 
         # Check directory was created
         assert visualizer.output_dir.exists()
         assert visualizer.output_dir.is_dir()
 
-    def test_generate_no_components(self, config, temp_project):
+    def test_generate_no_components(self, default_generated):
         """Test generation with empty project (no components)"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        language_analysis = {}
-        decisions = {"decisions": []}
-
-        result = visualizer.generate(temp_project, language_analysis, decisions)
+        visualizer, result = default_generated
 
         # Should generate 2 diagrams (component + dataflow)
         assert result["count"] == 2
         assert len(result["diagrams"]) == 2
 
-    def test_generate_component_diagram_frontend_only(self, config, temp_project):
-        """Test component diagram with frontend only"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        language_analysis = {
-            "frameworks": {
-                "frontend": ["React"]
-            }
-        }
-        decisions = {"decisions": []}
-
-        result = visualizer.generate(temp_project, language_analysis, decisions)
-
-        # Check component diagram content
-        component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
-
-        assert "graph TD" in content
-        assert "Frontend[React]" in content
-
-    def test_generate_component_diagram_backend_only(self, config, temp_project):
-        """Test component diagram with backend only"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        language_analysis = {
-            "frameworks": {
-                "backend": ["Django"]
-            }
-        }
-        decisions = {"decisions": []}
-
-        result = visualizer.generate(temp_project, language_analysis, decisions)
+    @pytest.mark.parametrize("language_analysis,decisions,expected_substrings,forbidden_substrings", [
+        pytest.param(
+            {"frameworks": {"frontend": ["React"]}},
+            {"decisions": []},
+            ["graph TD", "Frontend[React]"], [],
+            id="frontend_only"),
+        pytest.param(
+            {"frameworks": {"backend": ["Django"]}},
+            {"decisions": []},
+            ["Backend[Django]"], [],
+            id="backend_only"),
+        pytest.param(
+            {},
+            {"decisions": [{"category": "database", "decision": "Use PostgreSQL for database"}]},
+            ["Database[(PostgreSQL)]"], [],
+            id="database_only"),
+        pytest.param(
+            {"frameworks": {"frontend": ["React"], "backend": ["Django"]}},
+            {"decisions": [{"category": "database", "decision": "Use PostgreSQL for database"}]},
+            ["Frontend[React]", "Backend[Django]", "Database[(PostgreSQL)]",
+             "Frontend --> Backend", "Backend --> Database"], [],
+            id="full_stack"),
+        pytest.param(
+            {"frameworks": {"frontend": ["Vue"], "backend": ["Flask"]}},
+            {"decisions": []},
+            ["Frontend --> Backend"], [],
+            id="connections"),
+        # Database name is extracted from the decision text
+        pytest.param(
+            {},
+            {"decisions": [{"category": "database", "decision": "Use MongoDB for database"}]},
+            ["Database[(MongoDB)]"], [],
+            id="database_extraction"),
+        # With multiple frameworks, only the first is used
+        pytest.param(
+            {"frameworks": {"frontend": ["React", "Vue", "Angular"], "backend": ["Django", "Flask"]}},
+            {"decisions": []},
+            ["Frontend[React]", "Backend[Django]"], ["Vue", "Flask"],
+            id="multiple_frameworks"),
+    ])
+    def test_generate_component_diagram(self, viz_cache, language_analysis, decisions,
+                                        expected_substrings, forbidden_substrings):
+        """Test component diagram content for different project shapes"""
+        visualizer, result = viz_cache(language_analysis, decisions)
 
         component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
-
-        assert "Backend[Django]" in content
-
-    def test_generate_component_diagram_database_only(self, config, temp_project):
-        """Test component diagram with database decision only"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        language_analysis = {}
-        decisions = {
-            "decisions": [
-                {
-                    "category": "database",
-                    "decision": "Use PostgreSQL for database"
-                }
-            ]
-        }
-
-        result = visualizer.generate(temp_project, language_analysis, decisions)
-
-        component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
-
-        assert "Database[(PostgreSQL)]" in content
-
-    def test_generate_component_diagram_full_stack(self, config, temp_project):
-        """Test component diagram with frontend, backend, and database"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        language_analysis = {
-            "frameworks": {
-                "frontend": ["React"],
-                "backend": ["Django"]
-            }
-        }
-        decisions = {
-            "decisions": [
-                {
-                    "category": "database",
-                    "decision": "Use PostgreSQL for database"
-                }
-            ]
-        }
+        content = component_path.read_text(encoding="utf-8")
 
-        result = visualizer.generate(temp_project, language_analysis, decisions)
+        missing = {m for m in expected_substrings if m not in content}
+        assert not missing, f"Missing from component diagram: {missing}"
+        unexpected = {m for m in forbidden_substrings if m in content}
+        assert not unexpected, f"Unexpected in component diagram: {unexpected}"
 
-        component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
-
-        # Check all components
-        assert "Frontend[React]" in content
-        assert "Backend[Django]" in content
-        assert "Database[(PostgreSQL)]" in content
-
-        # Check connections
-        assert "Frontend --> Backend" in content
-        assert "Backend --> Database" in content
-
-    def test_generate_component_diagram_connections(self, config, temp_project):
-        """Test that component connections are correct"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        language_analysis = {
-            "frameworks": {
-                "frontend": ["Vue"],
-                "backend": ["Flask"]
-            }
-        }
-        decisions = {"decisions": []}
-
-        result = visualizer.generate(temp_project, language_analysis, decisions)
-
-        component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
-
-        # Should connect frontend to backend
-        assert "Frontend --> Backend" in content
-
-    def test_generate_dataflow_diagram(self, config, temp_project):
+    def test_generate_dataflow_diagram(self, default_generated):
         """Test data flow diagram generation"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        result = visualizer.generate(temp_project, {}, {"decisions": []})
+        visualizer, result = default_generated
 
         # Check dataflow diagram
         dataflow_path = visualizer.output_dir / "data-flow.mmd"
-        content = dataflow_path.read_text()
+        content = dataflow_path.read_text(encoding="utf-8")
 
-        assert "graph LR" in content
-        assert "User((User))" in content
-        assert "API[API Gateway]" in content
-        assert "Backend[Backend Service]" in content
-        assert "DB[(Database)]" in content
-        assert "HTTP Request" in content
-        assert "HTTP Response" in content
+        needles = {"graph LR", "User((User))", "API[API Gateway]", "Backend[Backend Service]",
+                   "DB[(Database)]", "HTTP Request", "HTTP Response"}
+        missing = {m for m in needles if m not in content}
+        assert not missing, f"Missing from data flow diagram: {missing}"
 
-    def test_generate_mermaid_syntax(self, config, temp_project):
+    def test_generate_mermaid_syntax(self, viz_cache):
         """Test that generated diagrams have valid Mermaid syntax"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
         language_analysis = {
             "frameworks": {
                 "frontend": ["React"],
@@ -224,24 +158,21 @@ class TestArchitectureVisualizer:
             }
         }
 
-        result = visualizer.generate(temp_project, language_analysis, {"decisions": []})
+        visualizer, result = viz_cache(language_analysis, {"decisions": []})
 
         # Component diagram should start with 'graph TD'
         component_path = visualizer.output_dir / "component-diagram.mmd"
-        component_content = component_path.read_text()
+        component_content = component_path.read_text(encoding="utf-8")
         assert component_content.startswith("graph TD")
 
         # Dataflow diagram should start with 'graph LR'
         dataflow_path = visualizer.output_dir / "data-flow.mmd"
-        dataflow_content = dataflow_path.read_text()
+        dataflow_content = dataflow_path.read_text(encoding="utf-8")
         assert dataflow_content.startswith("graph LR")
 
-    def test_generate_result_structure(self, config, temp_project):
+    def test_generate_result_structure(self, default_generated):
         """Test that generate() returns correct structure"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        result = visualizer.generate(temp_project, {}, {"decisions": []})
+        visualizer, result = default_generated
 
         # Check result structure
         assert "diagrams" in result
@@ -257,12 +188,9 @@ class TestArchitectureVisualizer:
             assert "format" in diagram
             assert diagram["format"] == "mermaid"
 
-    def test_generate_file_creation(self, config, temp_project):
+    def test_generate_file_creation(self, default_generated):
         """Test that diagram files are actually created"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        result = visualizer.generate(temp_project, {}, {"decisions": []})
+        visualizer, result = default_generated
 
         # Check files exist
         component_path = visualizer.output_dir / "component-diagram.mmd"
@@ -274,92 +202,34 @@ class TestArchitectureVisualizer:
         assert dataflow_path.is_file()
 
         # Check files are not empty
-        assert len(component_path.read_text()) > 0
-        assert len(dataflow_path.read_text()) > 0
-
-    def test_component_diagram_database_extraction(self, config, temp_project):
-        """Test database name extraction from decision text"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
+        assert component_path.stat().st_size > 0
+        assert dataflow_path.stat().st_size > 0
 
-        # Test different database decision formats
-        decisions = {
-            "decisions": [
-                {
-                    "category": "database",
-                    "decision": "Use MongoDB for database"
-                }
-            ]
-        }
-
-        result = visualizer.generate(temp_project, {}, decisions)
-
-        component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
-
-        # Should extract "MongoDB" from decision text
-        assert "Database[(MongoDB)]" in content
-
-    def test_generate_multiple_frameworks(self, config, temp_project):
-        """Test that with multiple frameworks, only first is used"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        language_analysis = {
-            "frameworks": {
-                "frontend": ["React", "Vue", "Angular"],
-                "backend": ["Django", "Flask"]
-            }
-        }
-
-        result = visualizer.generate(temp_project, language_analysis, {"decisions": []})
-
-        component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
-
-        # Should use first framework only
-        assert "Frontend[React]" in content
-        assert "Backend[Django]" in content
-        assert "Vue" not in content
-        assert "Flask" not in content
-
-    def test_generate_diagram_types(self, config, temp_project):
+    def test_generate_diagram_types(self, default_generated):
         """Test that correct diagram types are set"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        result = visualizer.generate(temp_project, {}, {"decisions": []})
+        visualizer, result = default_generated
 
         # Check diagram types
         types = [d["type"] for d in result["diagrams"]]
         assert "component" in types
         assert "dataflow" in types
 
-    def test_generate_diagram_names(self, config, temp_project):
+    def test_generate_diagram_names(self, default_generated):
         """Test that diagram names are descriptive"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
-        result = visualizer.generate(temp_project, {}, {"decisions": []})
+        visualizer, result = default_generated
 
         # Check diagram names
         names = [d["name"] for d in result["diagrams"]]
         assert "Component Diagram" in names
         assert "Data Flow" in names
 
-    def test_component_diagram_no_connections_without_components(self, config, temp_project):
+    def test_component_diagram_no_connections_without_components(self, default_generated):
         """Test that no connections are added when components don't exist"""
-        config["general"]["output_dir"] = str(temp_project / ".agentic_sdlc")
-        visualizer = ArchitectureVisualizer(config)
-
         # Empty language analysis
-        language_analysis = {}
-        decisions = {"decisions": []}
-
-        result = visualizer.generate(temp_project, language_analysis, decisions)
+        visualizer, result = default_generated
 
         component_path = visualizer.output_dir / "component-diagram.mmd"
-        content = component_path.read_text()
+        content = component_path.read_text(encoding="utf-8")
 
         # Should not have any connections
         assert "-->" not in content
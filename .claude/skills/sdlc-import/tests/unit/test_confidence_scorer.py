@@ -3,13 +3,9 @@
 Unit tests for confidence_scorer.py
 """
 
-import sys
-import pytest
-from pathlib import Path
+import dataclasses
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / ".claude/lib/python"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+import pytest
 
 from confidence_scorer import (
     ConfidenceScorer,
@@ -18,13 +14,28 @@ from confidence_scorer import (
     ConfidenceScore
 )
 
+# Shared, never-mutated evidence (built once at import; tests pass list copies)
+_FULL_QUALITY = tuple(Evidence(f"f{i}.py", i, "p", 1.0, "pattern") for i in range(1, 6))
+_MEDIUM_QUALITY = tuple(Evidence(f"f{i}.py", i, "p", 0.7, "pattern") for i in range(1, 4))
+_LOW_QUALITY = (Evidence("f.py", 1, "p", 0.3, "pattern"),)
+_LLM_EVIDENCE = Evidence("s", 0, "llm", 1.0, "llm")
+
+# Expected consistency = (source_diversity + location_diversity) / 2
+_CONSISTENCY_1_SOURCE_1_FILE = 0.416    # (1/2 + 1/3) / 2
+_CONSISTENCY_2_SOURCES_2_FILES = 0.833  # (2/2 + 2/3) / 2
+_CONSISTENCY_1_SOURCE_3_FILES = 0.75    # (1/2 + 3/3) / 2
+
+# overall = 0.4*quality + 0.3*quantity + 0.2*consistency + 0.1*llm_bonus
+# for two full-quality pattern evidence in one file: 0.633
+_EXPECTED_FORMULA = 0.4 * 1.0 + 0.3 * 0.5 + 0.2 * _CONSISTENCY_1_SOURCE_1_FILE + 0.1 * 0.0
+
 
 class TestConfidenceScorer:
     """Test confidence scoring"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def scorer(self):
-        """Create scorer instance"""
+        """Scorer instance shared by the module (no test mutates it)"""
         return ConfidenceScorer()
 
     def test_evidence_quality_empty(self, scorer):
@@ -56,25 +67,12 @@ class TestConfidenceScorer:
 
     def test_evidence_quantity_scale(self, scorer):
         """Test evidence quantity logarithmic scale"""
-        # 1 evidence = 0.3
-        evidence_1 = [Evidence("file.py", 1, "p", 1.0, "pattern")]
-        assert scorer.calculate_evidence_quantity(evidence_1) == 0.3
-
-        # 2 evidence = 0.5
-        evidence_2 = evidence_1 + [Evidence("file2.py", 2, "p", 1.0, "pattern")]
-        assert scorer.calculate_evidence_quantity(evidence_2) == 0.5
-
-        # 3 evidence = 0.7
-        evidence_3 = evidence_2 + [Evidence("file3.py", 3, "p", 1.0, "pattern")]
-        assert scorer.calculate_evidence_quantity(evidence_3) == 0.7
-
-        # 4 evidence = 0.85
-        evidence_4 = evidence_3 + [Evidence("file4.py", 4, "p", 1.0, "pattern")]
-        assert scorer.calculate_evidence_quantity(evidence_4) == 0.85
-
-        # 5+ evidence = 1.0
-        evidence_5 = evidence_4 + [Evidence("file5.py", 5, "p", 1.0, "pattern")]
-        assert scorer.calculate_evidence_quantity(evidence_5) == 1.0
+        # 1 evidence = 0.3, 2 = 0.5, 3 = 0.7, 4 = 0.85, 5+ = 1.0
+        assert scorer.calculate_evidence_quantity(list(_FULL_QUALITY[:1])) == 0.3
+        assert scorer.calculate_evidence_quantity(list(_FULL_QUALITY[:2])) == 0.5
+        assert scorer.calculate_evidence_quantity(list(_FULL_QUALITY[:3])) == 0.7
+        assert scorer.calculate_evidence_quantity(list(_FULL_QUALITY[:4])) == 0.85
+        assert scorer.calculate_evidence_quantity(list(_FULL_QUALITY)) == 1.0
 
     def test_consistency_empty(self, scorer):
         """Test consistency with no evidence"""
@@ -87,8 +85,7 @@ class TestConfidenceScorer:
         result = scorer.calculate_consistency(evidence)
         # source_diversity = 1/2 = 0.5
         # location_diversity = 1/3 = 0.333
-        # consistency = (0.5 + 0.333) / 2 = 0.416
-        assert result == pytest.approx(0.416, abs=0.01)
+        assert result == pytest.approx(_CONSISTENCY_1_SOURCE_1_FILE, abs=0.01)
 
     def test_consistency_multiple_sources(self, scorer):
         """Test consistency with multiple sources"""
@@ -99,8 +96,7 @@ class TestConfidenceScorer:
         result = scorer.calculate_consistency(evidence)
         # source_diversity = 2/2 = 1.0
         # location_diversity = 2/3 = 0.666
-        # consistency = (1.0 + 0.666) / 2 = 0.833
-        assert result == pytest.approx(0.833, abs=0.01)
+        assert result == pytest.approx(_CONSISTENCY_2_SOURCES_2_FILES, abs=0.01)
 
     def test_consistency_multiple_files(self, scorer):
         """Test consistency with evidence from multiple files"""
@@ -112,8 +108,7 @@ class TestConfidenceScorer:
         result = scorer.calculate_consistency(evidence)
         # source_diversity = 1/2 = 0.5
         # location_diversity = 3/3 = 1.0 (capped)
-        # consistency = (0.5 + 1.0) / 2 = 0.75
-        assert result == pytest.approx(0.75, abs=0.01)
+        assert result == pytest.approx(_CONSISTENCY_1_SOURCE_3_FILES, abs=0.01)
 
     def test_llm_bonus_no_llm(self, scorer):
         """Test LLM bonus without LLM evidence"""
@@ -146,11 +141,15 @@ class TestConfidenceScorer:
         score = scorer.calculate(evidence)
 
         assert score.overall >= 0.8
-        assert score.level == ConfidenceLevel.HIGH
-        assert score.evidence_count == 5
         assert score.evidence_quality > 0.8
-        assert score.evidence_quantity == 1.0  # 5+ evidence
-        assert score.llm_bonus == 1.0
+        expected = {
+            "level": ConfidenceLevel.HIGH,
+            "evidence_count": 5,
+            "evidence_quantity": 1.0,  # 5+ evidence
+            "llm_bonus": 1.0,
+        }
+        fields = dataclasses.asdict(score)
+        assert {name: fields[name] for name in expected} == expected
 
     def test_calculate_medium_confidence(self, scorer):
         """Test medium confidence scenario (0.5-0.8)"""
@@ -224,46 +223,22 @@ class TestConfidenceScorer:
         ]
         score = scorer.calculate(evidence)
 
-        # Manual calculation:
-        # quality = 1.0
-        # quantity = 0.5 (2 evidence)
-        # consistency = (0.5 + 0.333) / 2 = 0.416 (1 source, 1 file)
-        # llm_bonus = 0.0
-        # overall = 0.4*1.0 + 0.3*0.5 + 0.2*0.416 + 0.1*0.0 = 0.633
-
-        expected = 0.4 * 1.0 + 0.3 * 0.5 + 0.2 * 0.416 + 0.1 * 0.0
-        assert score.overall == pytest.approx(expected, abs=0.01)
-
-    def test_threshold_boundaries(self, scorer):
+        # quality = 1.0, quantity = 0.5 (2 evidence), 1 source / 1 file, no LLM
+        assert score.overall == pytest.approx(_EXPECTED_FORMULA, abs=0.01)
+
+    @pytest.mark.parametrize("evidence,expected_level,min_overall,max_overall", [
+        # HIGH boundary (>= 0.8)
+        pytest.param([*_FULL_QUALITY[:4], _LLM_EVIDENCE], ConfidenceLevel.HIGH, 0.8, 1.01, id="high"),
+        # MEDIUM boundary (0.5 - 0.8): needs 3+ evidence with decent quality to reach 0.5
+        pytest.param(list(_MEDIUM_QUALITY), ConfidenceLevel.MEDIUM, 0.5, 0.8, id="medium"),
+        # LOW (below 0.5)
+        pytest.param(list(_LOW_QUALITY), ConfidenceLevel.LOW, 0.0, 0.5, id="low"),
+    ])
+    def test_threshold_boundaries(self, scorer, evidence, expected_level, min_overall, max_overall):
         """Test confidence level boundaries"""
-        # Test HIGH boundary (>= 0.8)
-        evidence_high = [
-            Evidence("f1.py", 1, "p", 1.0, "pattern"),
-            Evidence("f2.py", 2, "p", 1.0, "pattern"),
-            Evidence("f3.py", 3, "p", 1.0, "pattern"),
-            Evidence("f4.py", 4, "p", 1.0, "pattern"),
-            Evidence("s", 0, "llm", 1.0, "llm"),
-        ]
-        score_high = scorer.calculate(evidence_high)
-        assert score_high.overall >= 0.8
-        assert score_high.level == ConfidenceLevel.HIGH
-
-        # Test MEDIUM boundary (0.5 - 0.8)
-        # Need 3+ evidence with decent quality to reach 0.5
-        evidence_medium = [
-            Evidence("f1.py", 1, "p", 0.7, "pattern"),
-            Evidence("f2.py", 2, "p", 0.7, "pattern"),
-            Evidence("f3.py", 3, "p", 0.7, "pattern"),
-        ]
-        score_medium = scorer.calculate(evidence_medium)
-        assert 0.5 <= score_medium.overall < 0.8
-        assert score_medium.level == ConfidenceLevel.MEDIUM
-
-        # Test LOW (below 0.5)
-        evidence_low = [Evidence("f.py", 1, "p", 0.3, "pattern")]
-        score_low = scorer.calculate(evidence_low)
-        assert score_low.overall < 0.5
-        assert score_low.level == ConfidenceLevel.LOW
+        score = scorer.calculate(evidence)
+        assert min_overall <= score.overall < max_overall
+        assert score.level == expected_level
 
     def test_evidence_dataclass(self):
         """Test Evidence dataclass"""
@@ -283,20 +258,16 @@ class TestConfidenceScorer:
 
     def test_confidence_score_dataclass(self):
         """Test ConfidenceScore dataclass"""
-        score = ConfidenceScore(
-            overall=0.85,
-            level=ConfidenceLevel.HIGH,
-            evidence_quality=0.9,
-            evidence_quantity=0.85,
-            consistency=0.8,
-            llm_bonus=1.0,
-            evidence_count=5
-        )
-
-        assert score.overall == 0.85
-        assert score.level == ConfidenceLevel.HIGH
-        assert score.evidence_quality == 0.9
-        assert score.evidence_quantity == 0.85
-        assert score.consistency == 0.8
-        assert score.llm_bonus == 1.0
-        assert score.evidence_count == 5
+        expected = {
+            "overall": 0.85,
+            "level": ConfidenceLevel.HIGH,
+            "evidence_quality": 0.9,
+            "evidence_quantity": 0.85,
+            "consistency": 0.8,
+            "llm_bonus": 1.0,
+            "evidence_count": 5,
+        }
+        score = ConfidenceScore(**expected)
+
+        fields = dataclasses.asdict(score)
+        assert {name: fields[name] for name in expected} == expected
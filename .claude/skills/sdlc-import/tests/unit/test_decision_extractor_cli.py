@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the decision_extractor.py command-line entry point
+
+Kept apart from test_decision_extractor.py so they only import main().
+"""
+
+import io
+import json
+
+import pytest
+
+from decision_extractor import main
+
+
+@pytest.fixture
+def postgres_project(tmp_path):
+    """Project whose only decision evidence is a PostgreSQL database URL"""
+    (tmp_path / ".env").write_text("DATABASE_URL=postgres://localhost/app\n")
+    return tmp_path
+
+
+def test_main_writes_json_to_stdout_argument(postgres_project):
+    """main() prints indented JSON to the given stream"""
+    out = io.StringIO()
+
+    main([str(postgres_project), "--no-llm"], stdout=out)
+
+    output = out.getvalue()
+    assert output.startswith("{\n  ")
+    result = json.loads(output)
+    assert result["count"] == 1
+    assert len(result["decisions"]) == 1
+
+
+def test_main_defaults_to_sys_stdout(postgres_project, capsys):
+    """Without a stdout argument, main() prints to sys.stdout"""
+    main([str(postgres_project), "--no-llm"])
+
+    assert json.loads(capsys.readouterr().out)["count"] == 1
+
+
+def test_main_reads_config_argument(postgres_project, tmp_path_factory):
+    """--config replaces the bundled import_config.yml"""
+    missing = tmp_path_factory.mktemp("config") / "missing.yml"
+
+    with pytest.raises(FileNotFoundError):
+        main([str(postgres_project), "--config", str(missing)], stdout=io.StringIO())
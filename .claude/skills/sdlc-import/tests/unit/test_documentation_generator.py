@@ -15,6 +15,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from documentation_generator import DocumentationGenerator
 
+# libyaml-backed loader when PyYAML was built with it; same results as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @pytest.fixture
 def config():
@@ -173,7 +176,7 @@ class TestDocumentationGenerator:
 
         # Read and parse YAML
         adr_file = Path(adrs[0])
-        content = yaml.safe_load(adr_file.read_text())
+        content = yaml.load(adr_file.read_text(), Loader=_YAML_LOADER)
 
         # Check structure
         assert content["id"] == "ADR-INFERRED-001"
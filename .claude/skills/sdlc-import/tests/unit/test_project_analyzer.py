@@ -3,6 +3,7 @@
 Unit tests for project_analyzer.py
 """
 
+import subprocess
 import sys
 import pytest
 import tempfile
@@ -30,6 +31,12 @@ def create_file(path: Path, content: str):
     path.write_text(content)
 
 
+def _git(args, cwd: Path):
+    """Run a git command in cwd, discarding its output (never inspected)"""
+    subprocess.run(["git", *args], cwd=str(cwd), check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
 class TestProjectAnalyzer:
     """Test project analyzer orchestration"""
 
@@ -298,15 +305,14 @@ class TestProjectAnalyzer:
     def test_analyze_minimal_project(self, temp_project):
         """Test analyze() on minimal project"""
         # Initialize git repository
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["init"], temp_project)
+        _git(["config", "user.email", "test@example.com"], temp_project)
+        _git(["config", "user.name", "Test User"], temp_project)
 
         # Create minimal valid project
         create_file(temp_project / "main.py", "print('hello')\n")
-        subprocess.run(["git", "add", "."], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "initial"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["add", "."], temp_project)
+        _git(["commit", "-m", "initial"], temp_project)
 
         analyzer = ProjectAnalyzer(str(temp_project))
         result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)
@@ -322,14 +328,13 @@ class TestProjectAnalyzer:
     def test_analyze_with_skip_threat_model(self, temp_project):
         """Test analyze() with skip_threat_model flag"""
         # Initialize git
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["init"], temp_project)
+        _git(["config", "user.email", "test@example.com"], temp_project)
+        _git(["config", "user.name", "Test User"], temp_project)
 
         create_file(temp_project / "main.py", "code")
-        subprocess.run(["git", "add", "."], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "initial"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["add", "."], temp_project)
+        _git(["commit", "-m", "initial"], temp_project)
 
         analyzer = ProjectAnalyzer(str(temp_project))
         # Override config to disable threat modeling (config precedence > flags)
@@ -342,14 +347,13 @@ class TestProjectAnalyzer:
     def test_analyze_with_skip_tech_debt(self, temp_project):
         """Test analyze() with skip_tech_debt flag"""
         # Initialize git
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["init"], temp_project)
+        _git(["config", "user.email", "test@example.com"], temp_project)
+        _git(["config", "user.name", "Test User"], temp_project)
 
         create_file(temp_project / "main.py", "code")
-        subprocess.run(["git", "add", "."], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "initial"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["add", "."], temp_project)
+        _git(["commit", "-m", "initial"], temp_project)
 
         analyzer = ProjectAnalyzer(str(temp_project))
         result = analyzer.analyze(skip_tech_debt=True)
@@ -360,14 +364,13 @@ class TestProjectAnalyzer:
     def test_analyze_result_has_timestamp(self, temp_project):
         """Test that analyze() result includes ISO timestamp"""
         # Initialize git
-        import subprocess
-        subprocess.run(["git", "init"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["init"], temp_project)
+        _git(["config", "user.email", "test@example.com"], temp_project)
+        _git(["config", "user.name", "Test User"], temp_project)
 
         create_file(temp_project / "main.py", "code")
-        subprocess.run(["git", "add", "."], cwd=str(temp_project), check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "initial"], cwd=str(temp_project), check=True, capture_output=True)
+        _git(["add", "."], temp_project)
+        _git(["commit", "-m", "initial"], temp_project)
 
         analyzer = ProjectAnalyzer(str(temp_project))
         result = analyzer.analyze(skip_threat_model=True, skip_tech_debt=True)